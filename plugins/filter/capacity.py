@@ -0,0 +1,70 @@
+# Copyright ©️ 2022 Dell Inc. or its subsidiaries.
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+import math
+from ansible.errors import AnsibleFilterError
+from ..module_utils import dd_numeric
+from ..module_utils.catalogues.filesys import filesys
+
+DOCUMENTATION = r'''
+name: capacity
+short_description: Fleet wide totals of filesys show space and show compression results
+description:
+    - dd_space_totals sums size, used, avail and cleanable bytes of one filesys show space resource over many
+      appliances, per group (tier by default) and overall, with the used ratio.
+    - dd_compression_totals sums pre-comp and post-comp bytes of one filesys show compression period over many
+      appliances, per group and overall, with the resulting compression factor.
+    - Input is a dict of appliance name to the registered filesys result (or its msg), structured or columnar.
+    - Requires numpy on the controller.
+'''
+
+EXAMPLES = r'''
+  - name: Space per tier across all appliances
+    debug:
+        msg: "{{ dict(groups['datadomain'] | zip(groups['datadomain'] | map('extract', hostvars, 'space'))) | dellemc.datadomain.dd_space_totals }}"
+
+  - name: Compression of the last 7 days per appliance
+    debug:
+        msg: "{{ results | dellemc.datadomain.dd_compression_totals(period='Last 7 days', by='host') }}"
+'''
+
+SPACE_COLUMNS = ['size', 'used', 'avail', 'cleanable']
+COMPRESSION_COLUMNS = ['pre_comp', 'post_comp']
+
+
+def fleet(results, action):
+    if not dd_numeric.HAS_NUMPY:
+        raise AnsibleFilterError(f'{action} totals require the numpy python library on the controller')
+    conditions, supported_commands = filesys()
+    rows = {}
+    for name, result in results.items():
+        if isinstance(result, dict) and 'msg' in result:
+            result = result['msg']
+        rows[name] = result
+    return dd_numeric.fleet_arrays(rows, conditions[action]['types'])
+
+
+def summarize(arrays, columns, by, numerator, denominator, label):
+    summary = dict(total=dd_numeric.totals(arrays, columns), groups={})
+    if by in arrays and len(arrays[by]):
+        summary['groups'] = dd_numeric.group_totals(arrays, by, columns)
+    for totals in [summary['total']] + list(summary['groups'].values()):
+        value = float(dd_numeric.ratio(totals.get(numerator, 0), totals.get(denominator, 0)))
+        totals[label] = None if math.isnan(value) else value
+    return summary
+
+
+def dd_space_totals(results, resource='/data: post-comp', by='tier'):
+    arrays = dd_numeric.mask_rows(fleet(results, 'filesys_show_space'), 'resource', resource)
+    return summarize(arrays, SPACE_COLUMNS, by, 'used', 'size', 'used_ratio')
+
+
+def dd_compression_totals(results, period='Currently Used:*', by='tier'):
+    arrays = dd_numeric.mask_rows(fleet(results, 'filesys_show_compression'), 'period', period)
+    return summarize(arrays, COMPRESSION_COLUMNS, by, 'pre_comp', 'post_comp', 'total_comp_factor')
+
+
+class FilterModule(object):
+    def filters(self):
+        return dict(dd_space_totals=dd_space_totals, dd_compression_totals=dd_compression_totals)
@@ -0,0 +1,58 @@
+# Copyright ©️ 2022 Dell Inc. or its subsidiaries.
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+from ansible.errors import AnsibleFilterError
+from ..module_utils import cmd_templates, dd_parser
+
+DOCUMENTATION = r'''
+name: diff
+short_description: Rows added, removed and changed between two runs of a show action
+description:
+    - dd_diff matches the rows of two results of the same show action on the action's natural key (for example
+      name for mtree_list, export for nfs_show, ctx for replication_show_config) and returns the added,
+      removed and changed rows. The comparison is linear in the number of rows.
+    - Either result can be the registered module result (or its msg), structured or columnar, or the
+      structured half of output_format both.
+    - A key (a column or a list of columns) can be given instead of the action.
+'''
+
+EXAMPLES = r'''
+  - name: Mtrees created or changed since the last run
+    debug:
+        msg: "{{ previous_mtrees | dellemc.datadomain.dd_diff(mtrees, action='mtree_list') }}"
+
+  - name: Exports whose client count changed
+    debug:
+        msg: "{{ (before | dellemc.datadomain.dd_diff(after, key='export')).changed | map(attribute='key') }}"
+'''
+
+
+def action_key(action):
+    for name, (conditions, supported_commands) in cmd_templates.catalogues():
+        if action in conditions:
+            return conditions[action].get('key')
+    return None
+
+
+def rows(result):
+    if isinstance(result, dict) and 'msg' in result:
+        result = result['msg']
+    if isinstance(result, dict) and 'structured' in result:
+        result = result['structured']
+    if not isinstance(result, (dict, list)):
+        raise AnsibleFilterError('dd_diff expects parsed show output, run the module with output_format '
+                                 'structured, columnar or both')
+    return result
+
+
+def dd_diff(before, after, action=None, key=None):
+    key = key or action_key(action)
+    if not key:
+        raise AnsibleFilterError(f'dd_diff needs a key, {action} does not declare one')
+    return dd_parser.diff_rows(rows(before), rows(after), key)
+
+
+class FilterModule(object):
+    def filters(self):
+        return dict(dd_diff=dd_diff)
@@ -0,0 +1,60 @@
+# Copyright ©️ 2022 Dell Inc. or its subsidiaries.
+# One command catalogue per module. A module imports only its own, so AnsiballZ ships and Python loads
+# just those commands, once. validate checks the shape of any catalogue.
+import json
+from string import Template
+
+REQUIRED_KEYS = ['query', 'req_key', 'will_change', 'header']
+LIST_KEYS = ['req_key', 'opt_key', 'transports']
+TRANSPORTS = ['ssh', 'rest']
+
+
+def validate(conditions, supported_commands, parsers=(), converters=()):
+    # Returns a list of problems, empty when the catalogue is sound. parsers and converters are the names
+    # a condition's parser and types may use; they are only checked when given.
+    problems = []
+    for action, condition in conditions.items():
+        for key in REQUIRED_KEYS:
+            if key not in condition:
+                problems.append(f'{action}: missing {key}')
+        if 'state' not in condition.get('query', {}):
+            problems.append(f'{action}: query has no state')
+        for key in LIST_KEYS:
+            if not isinstance(condition.get(key, []), list):
+                problems.append(f'{action}: {key} is not a list')
+        for transport in condition.get('transports', []):
+            if transport not in TRANSPORTS:
+                problems.append(f'{action}: unknown transport {transport}')
+        if 'rest' in condition.get('transports', []) and 'rest' not in condition:
+            problems.append(f'{action}: rest transport without rest settings')
+        if parsers and condition.get('parser') is not None and condition['parser'] not in parsers:
+            problems.append(f'{action}: unknown parser {condition["parser"]}')
+        for column, kind in (condition.get('types') or {}).items():
+            if converters and kind not in converters:
+                problems.append(f'{action}: unknown type {kind} for {column}')
+        header = condition.get('header') or []
+        for column in (condition.get('rest') or {}).get('columns') or {}:
+            if column not in header:
+                problems.append(f'{action}: rest column {column} is not in the header')
+        key = condition.get('key')
+        if key is not None and condition.get('parser') == 'table':
+            for column in [key] if isinstance(key, str) else key:
+                if column not in header:
+                    problems.append(f'{action}: key {column} is not in the header')
+        if action not in supported_commands:
+            problems.append(f'{action}: no command')
+            continue
+        try:
+            template = json.loads(supported_commands[action])
+        except ValueError as e:
+            problems.append(f'{action}: command is not JSON: {e}')
+            continue
+        if not isinstance(template, (list, dict)):
+            problems.append(f'{action}: command is neither a list nor a payload')
+            continue
+        for text in template if isinstance(template, list) else template.values():
+            if isinstance(text, str):
+                for match in Template.pattern.finditer(text):
+                    if match.group('invalid') is not None:
+                        problems.append(f'{action}: invalid placeholder in {text!r}')
+    return problems
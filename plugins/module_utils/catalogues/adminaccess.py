@@ -0,0 +1,16 @@
+# Copyright ©️ 2022 Dell Inc. or its subsidiaries.
+conditions = dict(
+    adminAccess_enable=dict(query=dict(state='enable'), req_key=['service'], will_change=True, header=None),
+    adminAccess_disable=dict(query=dict(state='disable'), req_key=['service'], will_change=True, header=None),
+    adminAccess_show=dict(query=dict(state='show'), req_key=[], will_change=False, header=None,
+                          parser='options'),
+)
+
+supported_commands = dict(adminAccess_enable='["adminaccess enable $service"]',
+                          adminAccess_disable='["adminaccess disable $service"]',
+                          adminAccess_show='["adminaccess show"]',
+                         )
+
+
+def adminaccess():
+    return conditions, supported_commands
@@ -0,0 +1,33 @@
+# Copyright ©️ 2022 Dell Inc. or its subsidiaries.
+conditions = dict(
+    cifs_share_create=dict(query=dict(state='create'), req_key=['share'], 
+                opt_key=['path', 'max-connections', 'clients', 'users'], will_change=True, header=None),
+    cifs_share_modify=dict(query=dict(state='modify'), req_key=['share'], 
+            opt_key=['max-connections', 'clients', 'users'], will_change=True, header=None),
+    cifs_share_destroy=dict(query=dict(state='destroy'), req_key=['share'], will_change=True, header=None),
+    cifs_share_disable=dict(query=dict(state='disable'), req_key=['share'], will_change=True, header=None),
+    cifs_share_enable=dict(query=dict(state='enable'), req_key=['share'], will_change=True, header=None), 
+    cifs_share_show=dict(query=dict(state='show'), req_key=['share'], will_change=False, header=None,
+                         parser='key_value'),
+    cifs_config_show=dict(query=dict(state='show'), req_key=[], will_change=False, header=None,
+                          parser='key_value'),
+    cifs_enable=dict(query=dict(state='enable'), req_key=[], will_change=True, header=None),
+    cifs_disable=dict(query=dict(state='disable'), req_key=[], will_change=True, header=None),
+    cifs_status=dict(query=dict(state='status'), req_key=[], will_change=False, header=None),
+)
+
+supported_commands = dict(cifs_enable='["cifs enable"]',
+                          cifs_disable='["cifs disable"]',
+                          cifs_status='["cifs status"]',
+                          cifs_share_create='["cifs share create $share"]',
+                          cifs_share_modify='["cifs share modify $share"]',
+                          cifs_share_destroy='["cifs share destroy $share"]',
+                          cifs_share_disable='["cifs share disable $share"]',
+                          cifs_share_enable='["cifs share enable $share"]',
+                          cifs_share_show='["cifs share show $share"]',
+                          cifs_config_show='["cifs show config"]',
+                          )
+
+
+def cifs():
+    return conditions, supported_commands
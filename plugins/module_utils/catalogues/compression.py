@@ -0,0 +1,44 @@
+# Copyright ©️ 2022 Dell Inc. or its subsidiaries.
+conditions = dict(
+    compression_schedule_enable=dict(query=dict(state='enable'), req_key=['schedule'], will_change=True, header=None),
+    compression_schedule_disable=dict(query=dict(state='disable'), req_key=['schedule'], will_change=True, header=None),
+    compression_schedule_destroy=dict(query=dict(state='destroy'), req_key=['schedule'], will_change=True, header=None),
+    compression_schedule_modify=dict(query=dict(state='modify'), req_key=['schedule'], will_change=True, header=None),
+    compression_schedule_del=dict(query=dict(state='del'), req_key=['schedule'], will_change=True, header=None),
+    compression_schedule_create=dict(query=dict(state='create'), req_key=['schedule'], will_change=True, header=None),
+    compression_schedule_add=dict(query=dict(state='add'), req_key=['schedule'], will_change=True, header=None),
+    compression_schedule_show=dict(query=dict(state='show'), req_key=['schedule'], will_change=False, header=None,
+                                   parser='table'),
+    compression_sample_stop=dict(query=dict(state='stop'), req_key=['sample'], will_change=True, header=None),
+    compression_sample_start=dict(query=dict(state='start'), req_key=['sample'], will_change=True, header=None),
+    compression_throttle_set=dict(query=dict(state='set'), req_key=['throttle'], will_change=True, header=None),
+    compression_throttle_reset=dict(query=dict(state='reset'), req_key=['throttle'], will_change=True, header=None),
+    compression_throttle_show=dict(query=dict(state='show'), req_key=['throttle'], will_change=False, header=None),
+    compression_status=dict(query=dict(state='status'), req_key=[], will_change=False, header=None),
+    compression_enable_initialize=dict(query=dict(state='enable'), req_key=['initialize'], will_change=True, header=None),
+    compression_enable=dict(query=dict(state='enable'), req_key=[], will_change=True, header=None),
+    compression_disable=dict(query=dict(state='disable'), req_key=[], will_change=True, header=None),
+
+)
+supported_commands = dict(compression_schedule_enable='["compression physical-capacity-measurement schedule enable $schedule"]',
+                          compression_schedule_disable='["compression physical-capacity-measurement schedule disable $schedule"]',
+                          compression_status='["compression physical-capacity-measurement status"]',
+                          compression_schedule_destroy='["compression physical-capacity-measurement schedule destroy $schedule"]',
+                          compression_schedule_modify='["compression physical-capacity-measurement schedule modify $schedule"]',
+                          compression_schedule_del='["compression physical-capacity-measurement schedule del $schedule"]',
+                          compression_schedule_create='["compression physical-capacity-measurement schedule create $schedule"]',
+                          compression_schedule_add='["compression physical-capacity-measurement schedule add $schedule"]',
+                          compression_schedule_show='["compression physical-capacity-measurement schedule show $schedule"]',
+                          compression_sample_stop='["compression physical-capacity-measurement sample stop $sample"]',
+                          compression_sample_start='["compression physical-capacity-measurement sample start $sample"]',
+                          compression_throttle_set='["compression physical-capacity-measurement throttle set $throttle"]',
+                          compression_throttle_reset='["compression physical-capacity-measurement throttle reset"]',
+                          compression_throttle_show='["compression physical-capacity-measurement throttle show"]',
+                          compression_enable = '["compression physical-capacity-measurement enable"]',
+                          compression_disable = '["compression physical-capacity-measurement disable"]',
+                          compression_enable_initialize='["compression physical-capacity-measurement enable and-initialize"]'
+                          )
+
+
+def compression():
+    return conditions, supported_commands
@@ -0,0 +1,32 @@
+# Copyright ©️ 2022 Dell Inc. or its subsidiaries.
+conditions = dict(
+    config_adminemail_set=dict(query=dict(state='set'), req_key=['option', 'admin-email'], will_change=True, header=None),
+    config_adminhost_set=dict(query=dict(state='set'), req_key=['option', 'admin-host'], will_change=True, header=None),
+    config_location_set=dict(query=dict(state='set'), req_key=['option', 'location'], will_change=True, header=None),
+    config_mailserver_set=dict(query=dict(state='set'), req_key=['option', 'mailserver'], will_change=True, header=None),
+    config_timezone_set=dict(query=dict(state='set'), req_key=['option', 'timezone'], will_change=True, header=None),
+    config_adminemail_reset=dict(query=dict(state='reset', option='admin-email'), req_key=['option'],
+                                 will_change=True, header=None),
+    config_adminhost_reset=dict(query=dict(state='reset', option='admin-host'), req_key=['option'],
+                                will_change=True, header=None),
+    config_location_reset=dict(query=dict(state='reset', option='location'), req_key=['option'], will_change=True, header=None),
+    config_mailserver_reset=dict(query=dict(state='reset', option='mailserver'), req_key=['option'],
+                                 will_change=True, header=None),
+    config_timezone_reset=dict(query=dict(state='reset', option='timezone'), req_key=['option'], will_change=True, header=None),
+)
+
+supported_commands = dict(config_adminemail_set='["config set admin-email $admin_email"]',
+                          config_adminhost_set='["config set admin-host $admin_host"]',
+                          config_location_set='["config set location $location"]',
+                          config_mailserver_set='["config set mailserver $mailserver"]',
+                          config_timezone_set='["config set timezone $timezone"]',
+                          config_adminemail_reset='["config reset admin-email"]',
+                          config_adminhost_reset='["config reset admin-mail"]',
+                          config_location_reset='["config reset location"]',
+                          config_mailserver_reset='["config reset mailserver"]',
+                          config_timezone_reset='["config reset timezone"]',
+                          )
+
+
+def config():
+    return conditions, supported_commands
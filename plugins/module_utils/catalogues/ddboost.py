@@ -0,0 +1,33 @@
+# Copyright ©️ 2022 Dell Inc. or its subsidiaries.
+conditions = dict(
+    ddboost_storage_unit_create=dict(query=dict(state='create'), req_key=['storage-unit', 'user-name'],
+                                     opt_key=['quota', 'stream-limit'], will_change=True, header=None),
+    ddboost_storage_unit_delete=dict(query=dict(state='delete'), req_key=['storage-unit'], will_change=True, header=None),
+    ddboost_storage_unit_modify=dict(query=dict(state='modify'), req_key=['storage-unit', 'user-name'],
+                                     opt_key=['quota', 'stream-limit'], will_change=True, header=None),
+    ddboost_storage_unit_rename=dict(query=dict(state='rename'), req_key=['storage-unit', 'new-storage-unit'],
+                                     will_change=True, header=None),
+    ddboost_storage_unit_undelete=dict(query=dict(state='undelete'), req_key=['storage-unit'], will_change=True, header=None),
+    ddboost_user_assign=dict(query=dict(state='assign'), req_key=['user-name'], will_change=True, header=None),
+    ddboost_user_unassign=dict(query=dict(state='unassign'), req_key=['user-name'], will_change=True, header=None),
+    ddboost_status=dict(query=dict(state='status'), req_key=[], will_change=True, header=None, parser='key_value'),
+    ddboost_enable=dict(query=dict(state='enable'), req_key=[], will_change=True, header=None),
+    ddboost_disable=dict(query=dict(state='disable'), req_key=[], will_change=True, header=None),
+)
+
+supported_commands = dict(
+    ddboost_storage_unit_create='["ddboost storage-unit create $storage_unit user $user_name"]',
+    ddboost_storage_unit_delete='["ddboost storage-unit delete $storage_unit"]',
+    ddboost_storage_unit_modify='["ddboost storage-unit modify $storage_unit user $user_name"]',
+    ddboost_storage_unit_rename='["ddboost storage-unit rename $storage_unit $new_storage_unit"]',
+    ddboost_storage_unit_undelete='["ddboost storage-unit undelete $storage_unit"]',
+    ddboost_user_assign='["ddboost user assign $user_name"]',
+    ddboost_user_unassign='["ddboost user unassign $user_name"]',
+    ddboost_status='["ddboost status"]',
+    ddboost_enable='["ddboost enable"]',
+    ddboost_disable='["ddboost disable"]',
+    )
+
+
+def ddboost():
+    return conditions, supported_commands
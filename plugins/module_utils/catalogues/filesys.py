@@ -0,0 +1,94 @@
+# Copyright ©️ 2022 Dell Inc. or its subsidiaries.
+conditions = dict(
+    filesys_clean_reset=dict(query=dict(state='reset', operation='clean'), req_key=['operation', 'clean'],
+                             will_change=True, header=None),
+    filesys_clean_set=dict(query=dict(state='set', operation='clean'), req_key=['operation', 'clean'], will_change=True, header=None),
+    filesys_clean_start=dict(query=dict(state='start', operation='clean'), req_key=['operation'], will_change=True, header=None),
+    filesys_clean_stop=dict(query=dict(state='stop', operation='clean'), req_key=['operation'], will_change=True, header=None),
+    filesys_encryption_abort=dict(query=dict(state='abort-apply-changes', operation='encryption'), req_key=['operation'],
+                                  will_change=True, header=None),
+    filesys_encryption_apply=dict(query=dict(state='apply-changes', operation='encryption'), req_key=['operation'],
+                                  will_change=True, header=None),
+    filesys_encryption_ekmgr_set=dict(
+        query=dict(state='set', operation='encryption', encryption='embedded-key-manager'),
+        req_key=['operation', 'encryption', 'key-rotation-policy'], will_change=True, header=None),
+    filesys_encryption_ekmgr_reset=dict(
+        query=dict(state='reset', operation='encryption', encryption='embedded-key-manager'),
+        req_key=['operation', 'encryption'],
+        opt_key=['key-rotation-policy'], will_change=True, header=None),
+    filesys_encryption_reset=dict(query=dict(state='reset', operation='encryption'), req_key=['operation', 'encryption'],
+                                  opt_key=['key-rotation-policy'], will_change=True, header=None),
+    filesys_encryption_km_ext_set=dict(query=dict(state='set', operation='encryption', encryption='key-manager'),
+                                       req_key=['operation', 'encryption', 'external-key-manager'], will_change=True, header=None),
+    filesys_encryption_km_krp_set=dict(query=dict(state='set', operation='encryption', encryption='key-manager'),
+                                       req_key=['operation', 'encryption', 'key-rotation-policy'], will_change=True, header=None),
+    filesys_encryption_algo_set=dict(query=dict(state='set', operation='encryption', encryption='algorithm'),
+                                     req_key=['operation', 'encryption', 'algorithm'], will_change=True, header=None),
+    filesys_encryption_create=dict(query=dict(state='create', operation='encryption'),
+                                   req_key=['operation', 'encryption'], will_change=True, header=None),
+    filesys_encryption_km_disable=dict(query=dict(state='disable', operation='encryption', encryption='key-manager'),
+                                       req_key=['operation', 'encryption'], will_change=True, header=None),
+    filesys_encryption_km_enable=dict(query=dict(state='enable', operation='encryption', encryption='key-manager'),
+                                      req_key=['operation', 'encryption'], will_change=True, header=None),
+    filesys_encryption_disable=dict(query=dict(state='disable', operation='encryption'),
+                                    req_key=['operation'], opt_key=['tier'], will_change=True, header=None),
+    filesys_encryption_enable=dict(query=dict(state='enable', operation='encryption'),
+                                   req_key=['operation'], opt_key=['tier'], will_change=True, header=None),
+    filesys_encryption_key_delete=dict(query=dict(state='delete', operation='encryption'),
+                                       req_key=['operation'], opt_key=['key-id', 'muid', 'tier'], will_change=True, header=None),
+    filesys_encryption_key_destroy=dict(query=dict(state='destroy', operation='encryption'),
+                                        req_key=['operation'], opt_key=['key-id', 'muid', 'tier'],
+                                        will_change=True, header=None),
+    filesys_encryption_key_sync=dict(query=dict(state='sync', operation='encryption'),
+                                     req_key=['operation'], will_change=True, header=None),
+    filesys_fastcopy_create=dict(query=dict(state='create', operation='fastcopy'),
+                                 req_key=['operation', 'fastcopy-source', 'fastcopy-destination'], will_change=True, header=None),
+    filesys_enable=dict(query=dict(state='enable'), req_key=[], will_change=True, header=None),
+    filesys_create=dict(query=dict(state='create'), req_key=[], will_change=True, header=None),
+    filesys_clean_status=dict(query=dict(state='status', operation='clean'), req_key=['operation'], will_change=True, header=None),
+    filesys_status=dict(query=dict(state='status'), req_key=[], will_change=True, header=None),
+    filesys_show_space=dict(query=dict(state='show', operation='space'), req_key=['operation'], will_change=False,
+                            header=['resource', 'size', 'used', 'avail', 'use_percent', 'cleanable'],
+                            parser='tiered', key=['tier', 'resource'],
+                            types=dict(size='gib', used='gib', avail='gib', use_percent='percent', cleanable='gib')),
+    filesys_show_compression=dict(query=dict(state='show', operation='compression'), req_key=['operation'],
+                                  will_change=False,
+                                  header=['period', 'pre_comp', 'post_comp', 'global_comp_factor',
+                                          'local_comp_factor', 'total_comp_factor'],
+                                  parser='tiered', key=['tier', 'period'],
+                                  types=dict(pre_comp='gib', post_comp='gib', global_comp_factor='factor',
+                                             local_comp_factor='factor', total_comp_factor='factor')),
+
+)
+
+supported_commands = dict(filesys_enable='["filesys enable"]',
+                          filesys_create='["filesys create"]',
+                          filesys_clean_reset='["filesys clean reset $clean"]',
+                          filesys_clean_set='["filesys clean set $clean"]',
+                          filesys_clean_start='["filesys clean start"]',
+                          filesys_clean_stop='["filesys clean stop"]',
+                          filesys_encryption_abort='["filesys encryption abort-apply-changes"]',
+                          filesys_encryption_apply='["filesys encryption apply-changes"]',
+                          filesys_encryption_reset='["filesys encryption $encryption reset"]',
+                          filesys_encryption_ekmgr_set='["filesys encryption embedded-key-manager set key-rotation-policy $key_rotation_policy"]',
+                          filesys_encryption_km_ext_set='["filesys encryption key-manager set $external_key_manager"]',
+                          filesys_encryption_km_krp_set='["filesys encryption key-manager set key-rotation-policy $key_rotation_policy"]',
+                          filesys_encryption_algo_set='["filesys encryption algorithm set $algorithm"]',
+                          filesys_encryption_ekmgr_reset='["filesys encryption embedded-key-manager reset key-rotation-policy"]',
+                          filesys_encryption_create='["filesys encryption $encryption keys create"]',
+                          filesys_encryption_km_disable='["filesys encryption key-manager disable"]',
+                          filesys_encryption_km_enable='["filesys encryption key-manager enable"]',
+                          filesys_encryption_disable='["filesys encryption disable"]',
+                          filesys_encryption_enable='["filesys encryption enable"]',
+                          filesys_encryption_key_delete='["filesys encryption keys delete"]',
+                          filesys_encryption_key_destroy='["filesys encryption keys destroy"]',
+                          filesys_encryption_key_sync='["filesys encryption keys sync"]',
+                          filesys_clean_status='["filesys clean status"]',
+                          filesys_fastcopy_create='["filesys fastcopy source $filecopy_source destination $filecopy_destination"]',
+                          filesys_status='["filesys status"]',
+                          filesys_show_space='["filesys show space"]',
+                          filesys_show_compression='["filesys show compression"]')
+
+
+def filesys():
+    return conditions, supported_commands
@@ -0,0 +1,55 @@
+# Copyright ©️ 2022 Dell Inc. or its subsidiaries.
+conditions = dict(
+    mtree_list=dict(query=dict(state='list'), req_key=[], will_change=False, header=['name', 'size', 'status'], parser='table',
+                    key='name', types=dict(size='gib', status='enum'), transports=['ssh', 'rest'],
+                    rest=dict(module='mtrees', request_type='get', columns=dict(size='logical_capacity.used'))),
+    mtree_alias_create=dict(query=dict(state='create'), req_key=['mtree-path', 'alias-name'], will_change=True, header=None),
+    mtree_create=dict(query=dict(state='create'), req_key=['mtree-path'], opt_key=['quota', 'tenant-unit'],
+                      will_change=True, header=None),
+    mtree_alias_delete=dict(query=dict(state='delete'), req_key=['alias-name'], will_change=True, header=None),
+    mtree_delete=dict(query=dict(state='delete'), req_key=['mtree-path'], will_change=True, header=None),
+    mtree_rename=dict(query=dict(state='rename'), req_key=['mtree-path', 'new-mtree-path'], will_change=True, header=None),
+    mtree_modify=dict(query=dict(state='modify'), req_key=['mtree-path', 'tenant-unit'], will_change=True, header=None),
+    mtree_achoring_algo_set=dict(query=dict(state='set'), req_key=['mtree-path', 'anchoring-algorithm'],
+                                 will_change=True, header=None),
+    mtree_app_optimized_set=dict(query=dict(state='set'), req_key=['mtree-path', 'app-optimized-compression'],
+                                 will_change=True, header=None),
+    mtree_randomio_set=dict(query=dict(state='set'), req_key=['mtree-path', 'randomio'], will_change=True, header=None),
+    mtree_achoring_algo_reset=dict(query=dict(state='reset'), req_key=['mtree-path', 'anchoring-algorithm'],
+                                   will_change=True, header=None),
+    mtree_app_optimized_reset=dict(query=dict(state='reset'), req_key=['mtree-path', 'app-optimized-compression'],
+                                   will_change=True, header=None),
+    mtree_randomio_reset=dict(query=dict(state='reset'), req_key=['mtree-path', 'randomio'], will_change=True, header=None),
+    mtree_retention_lock_enable=dict(query=dict(state='enable'), req_key=['mtree-path', 'retention-lock'],
+                                     will_change=True, header=None),
+    mtree_retention_lock_disable=dict(query=dict(state='disable'), req_key=['mtree-path', 'retention-lock'],
+                                      will_change=True, header=None),
+    mtree_retention_lock_set=dict(query=dict(state='set'), req_key=['mtree-path', 'retention'],
+                                  will_change=True, header=None),
+    mtree_retention_lock_reset=dict(query=dict(state='reset'), req_key=['mtree-path', 'retention'],
+                                    will_change=True, header=None),
+    mtree_undelete=dict(query=dict(state='undelete'), req_key=['mtree-path'], will_change=True, header=None),
+)
+
+supported_commands = dict(mtree_alias_create='["mtree alias create $alias_name mtree $mtree_path"]',
+                          mtree_create='["mtree create $mtree_path"]',
+                          mtree_alias_delete='["mtree alias delete $alias_name"]',
+                          mtree_delete='["mtree delete $mtree_path"]',
+                          mtree_rename='["mtree rename $mtree_path $new_mtree_path"]',
+                          mtree_modify='["mtree modify $mtree_path tenant-unit $tenant_unit"]',
+                          mtree_achoring_algo_set='["mtree option set anchoring-algorithm $anchoring_algorithm mtree $mtree_path"]',
+                          mtree_app_optimized_set='["mtree option set app-optimized-compression $app_optimized_compression mtree $mtree_path"]',
+                          mtree_randomio_set='["mtree option set randomio $randomio mtree $mtree_path"]',
+                          mtree_achoring_algo_reset='["mtree option reset anchoring-algorithm mtree $mtree_path"]',
+                          mtree_app_optimized_reset='["mtree option reset app-optimized-compression mtree $mtree_path"]',
+                          mtree_randomio_reset='["mtree option reset randomio mtree $mtree_path"]',
+                          mtree_retention_lock_enable='["mtree retention-lock enable mode $retention_lock mtree $mtree_path"]',
+                          mtree_retention_lock_disable='["mtree retention-lock disable mtree $mtree_path"]',
+                          mtree_retention_lock_set='["mtree retention-lock set $retention mtree $mtree_path"]',
+                          mtree_retention_lock_reset='["mtree retention-lock reset $retention mtree $mtree_path"]',
+                          mtree_undelete='["mtree undelete $mtree_path"]',
+                          mtree_list='["mtree list"]')
+
+
+def mtree():
+    return conditions, supported_commands
@@ -0,0 +1,86 @@
+# Copyright ©️ 2022 Dell Inc. or its subsidiaries.
+conditions = dict(
+    net_aggregate_add=dict(query=dict(state='add', option='aggregate'),
+                           req_key=['option', 'aggregate', 'virtual-ifname', 'physical-ifname'], will_change=True, header=None),
+    net_aggregate_del=dict(query=dict(state='del', option='aggregate'),
+                           req_key=['option', 'virtual-ifname', 'physical-ifname'], will_change=True, header=None),
+    net_aggregate_modify=dict(query=dict(state='modify', option='aggregate'),
+                              req_key=['option', 'virtual-ifname', 'aggregate'], will_change=True, header=None),
+    net_interface_config=dict(query=dict(state='config'),
+                              req_key=['ifname', 'ipaddr', 'netmask'], opt_key=['mtu'], will_change=True, header=None),
+    net_interface_create=dict(query=dict(state='create'), req_key=['ifname'], opt_key=['vlan'], will_change=True, header=None),
+    net_veth_create=dict(query=dict(state='create'), req_key=['vethid'], will_change=True, header=None),
+    net_interface_destroy=dict(query=dict(state='destroy'), req_key=['ifname'], will_change=True, header=None),
+    net_interface_enable=dict(query=dict(state='enable'), req_key=['ifname'], will_change=True, header=None),
+    net_failover_add=dict(query=dict(state='add', option='failover'),
+                          req_key=['option', 'virtual-ifname', 'ifname', 'failover'], will_change=True, header=None),
+    net_failover_del=dict(query=dict(state='del', option='failover'),
+                          req_key=['option', 'virtual-ifname', 'ifname'], will_change=True, header=None),
+    net_failover_modify=dict(query=dict(state='modify', option='failover'),
+                             req_key=['option', 'virtual-ifname', 'failover'], will_change=True, header=None),
+    net_hosts_add=dict(query=dict(state='add', option='hosts'), req_key=['option', 'host-list'], will_change=True, header=None),
+    net_hosts_del=dict(query=dict(state='del', option='hosts'), req_key=['option', 'ipaddr'], will_change=True, header=None),
+    net_hosts_reset=dict(query=dict(state='reset', option='hosts'), req_key=['option'], will_change=True, header=None),
+    net_lookup_test=dict(query=dict(state='test', option='lookup'), req_key=['option'], will_change=False, header=None),
+    net_ping_test=dict(query=dict(state='test', option='ping'), req_key=['option', 'ipaddr', 'count'], will_change=False, header=None),
+    net_domainname_reset=dict(query=dict(state='reset', option='domainname'), req_key=['option'], will_change=True, header=None),
+    net_searchdomains_reset=dict(query=dict(state='reset', option='searchdomains'), req_key=['option'],
+                                 will_change=True, header=None),
+    net_dns_reset=dict(query=dict(state='reset', option='dns'), req_key=['option'], will_change=True, header=None),
+    net_hostname_reset=dict(query=dict(state='reset', option='hostname'), req_key=['option'], will_change=True, header=None),
+    net_route_net_add=dict(query=dict(state='add', option='route', ),
+                           req_key=['option', 'network', 'netmask', 'gateway', 'ifname'], will_change=True, header=None),
+    net_route_host_add=dict(query=dict(state='add', option='route', ),
+                            req_key=['option', 'ipaddr', 'gateway', 'ifname'], will_change=True, header=None),
+    net_route_net_del=dict(query=dict(state='del', option='route'),
+                           req_key=['option', 'network', 'netmask', 'gateway', 'ifname'], will_change=True, header=None),
+    net_route_host_del=dict(query=dict(state='del', option='route'),
+                            req_key=['option', 'ipaddr', 'gateway', 'ifname'], will_change=True, header=None),
+    net_domainname_set=dict(query=dict(state='set', option='domainname'), req_key=['option', 'domainname'],
+                            will_change=True, header=None),
+    net_searchdomains_set=dict(query=dict(state='set', option='searchdomains'), req_key=['option', 'searchdomains'],
+                               will_change=True, header=None),
+    net_dns_set=dict(query=dict(state='set', option='dns'), req_key=['option', 'dns'], will_change=True, header=None),
+    net_hostname_set=dict(query=dict(state='set', option='hostname'), req_key=['option', 'hostname'],
+                          will_change=True, header=None),
+    net_settings_show=dict(query=dict(state='show'),
+                           req_key=[], will_change=False, header=["port", "enabled", "state", "DHCP", "IP address", "netmask", "type", "additional_setting"],
+                           parser='table', key='port', types=dict(enabled='bool', state='enum', DHCP='bool',
+                                                                 type='enum')),
+)
+
+supported_commands = dict(
+    net_aggregate_add='["net aggregate add $virtual_ifname interfaces $physical_ifname $aggregate"]',
+    net_aggregate_del='["net aggregate del $virtual_ifname interfaces $physical_ifname"]',
+    net_aggregate_modify='["net aggregate modify $virtual_ifname $aggregate"]',
+    net_interface_config='["net config $ifname $ipaddr netmask $netmask"]',
+    net_interface_create='["net create interface $ifname"]',
+    net_veth_create='["net create virtual veth$vethid"]',
+    net_interface_destroy='["net destroy $ifname"]',
+    net_interface_enable='["net enable $ifname"]',
+    net_failover_add='["net failover add $virtual_ifname interfaces $ifname $failover"]',
+    net_failover_del='["net failover del $virtual_ifname interfaces $ifname"]',
+    net_failover_modify='["net failover modify $virtual_ifname $failover"]',
+    net_hosts_add='["net hosts add $host_list"]',
+    net_hosts_del='["net hosts del $ipaddr"]',
+    net_hosts_reset='["net hosts reset"]',
+    net_lookup_test='["net lookup $ipaddr"]',
+    net_ping_test='["net ping $ipaddr count $count"]',
+    net_domainname_reset='["net reset domainname"]',
+    net_searchdomains_reset='["net reset searchdomains"]',
+    net_dns_reset='["net reset dns"]',
+    net_hostname_reset='["net reset hostname"]',
+    net_route_net_add='["net route add net $network netmask $netmask gw $gateway dev $ifname"]',
+    net_route_host_add='["net route add host $ipaddr gw $gateway dev $ifname"]',
+    net_route_net_del='["net route del net $network netmask $netmask gw $gateway dev $ifname"]',
+    net_route_host_del='["net route del host $ipaddr gw $gateway dev $ifname"]',
+    net_domainname_set='["net set domainname $domainname"]',
+    net_searchdomains_set='["net set searchdomains $searchdomains"]',
+    net_dns_set='["net set dns $dns"]',
+    net_hostname_set='["net set hostname $hostname"]',
+    net_settings_show='["net show settings"]',
+    )
+
+
+def net():
+    return conditions, supported_commands
@@ -0,0 +1,42 @@
+# Copyright ©️ 2022 Dell Inc. or its subsidiaries.
+conditions = dict(
+    nfs_export_add=dict(query=dict(state='add'), req_key=['export-name', 'clients'], will_change=True, header=None),
+    nfs_export_del=dict(query=dict(state='del'), req_key=['export-name', 'clients'], will_change=True, header=None),
+    nfs_disable=dict(query=dict(state='disable'), req_key=[], opt_key=['version'], will_change=True, header=None),
+    nfs_enable=dict(query=dict(state='enable'), req_key=[], opt_key=['version'], will_change=True, header=None),
+    nfs_export_create=dict(query=dict(state='create'), req_key=['export-name', 'path'],
+                           opt_key=['clients', 'options'], will_change=True, header=None),
+    nfs_export_destroy=dict(query=dict(state='destroy'), req_key=['export-name'], will_change=True, header=None),
+    nfs_export_modify=dict(query=dict(state='modify'),
+                           req_key=['export-name', 'clients', 'options'],
+                           will_change=True, header=None),
+    nfs_export_rename=dict(query=dict(state='rename'), req_key=['export-name', 'new-export-name'],
+                           will_change=True, header=None),
+    nfs_client_reset=dict(query=dict(state='reset'), req_key=[], will_change=True, header=None),
+    nfs_restart=dict(query=dict(state='restart'), req_key=[], opt_key=['version'], will_change=True, header=None),
+    nfs_status=dict(query=dict(state='status'), req_key=[], will_change=True, header=None),
+    nfs_show_ex=dict(query=dict(state='show'), req_key=['export-name'], will_change=False, header=["export", "path", "#clientEntries", "tenantUnit"],
+                     parser='table', key='export', types={"#clientEntries": "int", "tenantUnit": "enum"}),
+    nfs_show=dict(query=dict(state='show'), req_key=[], will_change=False, header=["export", "path", "#clientEntries", "tenantUnit"],
+                  parser='table', key='export', types={"#clientEntries": "int", "tenantUnit": "enum"}),
+
+)
+
+supported_commands = dict(nfs_export_add='["nfs export add $export_name clients $clients"]',
+                          nfs_export_del='["nfs export del $export_name clients $clients"]',
+                          nfs_disable='["nfs disable"]',
+                          nfs_enable='["nfs enable"]',
+                          nfs_export_create='["nfs export create $export_name path $path"]',
+                          nfs_export_destroy='["nfs export destroy $export_name"]',
+                          nfs_export_modify='["nfs export modify $export_name clients $clients options $options"]',
+                          nfs_export_rename='["nfs export rename $export_name $new_export_name"]',
+                          nfs_client_reset='["nfs reset clients"]',
+                          nfs_restart='["nfs restart"]',
+                          nfs_status='["nfs status"]',
+                          nfs_show_ex='["nfs export show list $export_name"]',
+                          nfs_show='["nfs export show list"]',
+                          )
+
+
+def nfs():
+    return conditions, supported_commands
@@ -0,0 +1,29 @@
+# Copyright ©️ 2022 Dell Inc. or its subsidiaries.
+conditions = dict(
+    ntp_timeserver_add=dict(query=dict(state='add'), req_key=['timeserver'], will_change=True, header=None),
+    ntp_timeserver_del=dict(query=dict(state='del'), req_key=['timeserver'], will_change=True, header=None),
+    ntp_timeserver_reset=dict(query=dict(state='reset'), req_key=['timeserver'], will_change=True, header=None),
+    ntp_enable=dict(query=dict(state='enable'), req_key=[], will_change=True, header=None),
+    ntp_disable=dict(query=dict(state='disable'), req_key=[], will_change=True, header=None),
+    ntp_reset=dict(query=dict(state='reset'), req_key=[], will_change=True, header=None),
+    ntp_sync=dict(query=dict(state='sync'), req_key=[], will_change=True, header=None),
+    ntp_status=dict(query=dict(state='status'), req_key=[], will_change=True, header=None, parser='key_value'),
+    ntp_show=dict(query=dict(state='show'), req_key=[], will_change=False, header=None, parser='key_value')
+
+)
+
+supported_commands = dict(ntp_timeserver_add='["ntp add timeserver $timeserver"]',
+                          ntp_timeserver_del='["ntp del timeserver $timeserver"]',
+                          ntp_timeserver_reset='["ntp reset timeserver"]',
+                          ntp_enable='["ntp enable"]',
+                          ntp_disable='["ntp disable"]',
+                          ntp_reset='["ntp reset"]',
+                          ntp_sync='["ntp sync"]',
+                          ntp_status='["ntp status"]',
+                          ntp_show='["ntp show config"]',
+
+                          )
+
+
+def ntp():
+    return conditions, supported_commands
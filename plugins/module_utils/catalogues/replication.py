@@ -0,0 +1,51 @@
+# Copyright ©️ 2022 Dell Inc. or its subsidiaries.
+conditions = dict(
+    replication_add=dict(query=dict(state='add'), req_key=['source', 'destination'],
+                         opt_key=['low-bw-optim', 'encryption', 'propagate-retention-lock', 'ipversion', 'max-repl-streams', 'destination-tenant-unit'], will_change=True, header=None),
+    replication_break=dict(query=dict(state='break'), req_key=['destination'], will_change=True, header=None),
+    replication_disable=dict(query=dict(state='disable'), req_key=['destination'], will_change=True, header=None),
+    replication_enable=dict(query=dict(state='enable'), req_key=['destination'], will_change=True, header=None),
+    replication_initialize=dict(query=dict(state='initialize'), req_key=['destination'],
+                                will_change=True, header=None),
+    replication_modify=dict(query=dict(state='modify'), req_key=['destination'], 
+                opt_key=['repl-port', 'low-bw-optim', 'encryption', 'max-repl-streams', 'destination-tenant-unit', 'crepl-gc-bw-optim', 'source-host', 'destination-host'], 
+                                   will_change=True, header=None),
+    replication_option_set=dict(query=dict(state='set'), req_key=['option'], 
+                opt_key=[], will_change=True, header=None),
+    replication_option_reset=dict(query=dict(state='reset'), req_key=['option'], 
+                opt_key=[], will_change=True, header=None),
+    replication_resync=dict(query=dict(state='resync'), req_key=['destination'], will_change=True, header=None),
+    replication_sync=dict(query=dict(state='sync'), req_key=['destination'], will_change=True, header=None),
+    replication_recover=dict(query=dict(state='recover'), req_key=['destination'], will_change=True, header=None),
+    replication_status=dict(query=dict(state='status'), req_key=[], will_change=True, header=None),
+    replication_show_option=dict(query=dict(state='show'), req_key=['option'], will_change=False, header=None,
+                                 parser='options'),
+    replication_show_config=dict(query=dict(state='show'), req_key=[], will_change=False, opt_key=['destination'],
+                                 header=["ctx", "source", "destination", "connection_host", "connection_port", "low-bw-optim", "repl-gc-bw-optim", "encryption", "enabled", "max-repl-streams"],
+                                 parser='table', key='ctx', types={"connection_port": "int", "low-bw-optim": "bool",
+                                                        "repl-gc-bw-optim": "bool", "encryption": "bool",
+                                                        "enabled": "bool", "max-repl-streams": "int"}),
+
+)
+
+supported_commands = dict(replication_add='["replication add source $source destination $destination"]',
+                          replication_break='["replication break $destination"]',
+                          replication_disable='["replication disable $destination"]',
+                          replication_enable='["replication enable $destination"]',
+                          replication_initialize='["replication initialize $destination"]',
+                          replication_modify='["replication modify $destination"]',
+                          replication_option_set='["replication option set $option"]',
+                          replication_option_reset='["replication option reset $option"]',
+                          replication_option_modify='["replication modify $destination $replication_options"]',
+                          replication_resync='["replication resync $destination"]',
+                          replication_sync='["replication sync $destination"]',
+                          replication_recover='["replication recover $destination"]',
+                          replication_status='["replication status"]',
+                          replication_show_config='["replication show config"]',
+                          replication_show_option='["replication option show"]'
+
+                          )
+
+
+def replication():
+    return conditions, supported_commands
@@ -0,0 +1,15 @@
+# Copyright ©️ 2022 Dell Inc. or its subsidiaries.
+conditions = dict(
+    stats_capacity=dict(query=dict(state='capacity'), req_key=[], will_change=False, header=None,
+                        transports=['rest'], rest=dict(module='stats/capacity', request_type='get')),
+    stats_performance=dict(query=dict(state='performance'), req_key=[], will_change=False, header=None,
+                           transports=['rest'], rest=dict(module='stats/performance', request_type='get')),
+)
+
+supported_commands = dict(stats_capacity='{}',
+                          stats_performance='{}',
+                          )
+
+
+def stats():
+    return conditions, supported_commands
@@ -0,0 +1,47 @@
+# Copyright ©️ 2022 Dell Inc. or its subsidiaries.
+conditions = dict(
+    user_add=dict(query=dict(state='add'), req_key=['user-name', 'user-password', 'dd-password', 'role-name'],
+                  opt_key=['aging'], will_change=True, header=None,
+                  transports=['rest'], rest=dict(module='users', request_type='post')),
+    user_pass_change=dict(query=dict(state='change'),
+                          req_key=['user-name', 'user-password', 'dd-password', 'new-password'], is_filter='user-name',
+                          will_change=True, header=None,
+                          transports=['rest'], rest=dict(module='users', request_type='put')),
+    user_role_change=dict(query=dict(state='change'), req_key=['user-name', 'role-name'], will_change=True, header=None),
+    user_enable=dict(query=dict(state='enable'), req_key=['user-name'], will_change=True, header=None),
+    user_disable=dict(query=dict(state='disable'), req_key=['user-name'], will_change=True, header=None),
+    user_del=dict(query=dict(state='del'), req_key=['user-name'], will_change=True, header=None),
+    user_aging_set=dict(query=dict(state='set'), req_key=['aging', 'user-name'], will_change=True, header=None),
+    user_aging_reset=dict(query=dict(state='reset'), req_key=['aging', 'user-name'], will_change=True, header=None),
+    user_default_aging_set=dict(query=dict(state='set'), req_key=['aging'], will_change=True, header=None),
+    user_default_aging_reset=dict(query=dict(state='reset'), req_key=['aging'], will_change=True, header=None),
+    user_strength_set=dict(query=dict(state='set'), req_key=['strength'], will_change=True, header=None),
+    user_strength_reset=dict(query=dict(state='reset'), req_key=['strength'], will_change=True, header=None),
+    user_show_details=dict(query=dict(state='show'), req_key=['user-name'], will_change=False,
+                           header=None, parser='key_value'),
+    user_show=dict(query=dict(state='show'), req_key=[], will_change=False,
+                   header=['name', 'uid', 'role', 'last_login_from', 'last_login_time',
+                           'status', 'disable_date'], parser='table', key='name',
+                   types=dict(uid='int', role='enum', last_login_time='time', status='enum', disable_date='time'),
+                   transports=['ssh', 'rest'], rest=dict(module='users', request_type='get'))
+    )
+
+supported_commands = dict(user_add='{"name": "$user_name", "role": "$role_name", "password": "$user_password"}',
+                          user_pass_change='{"current_password": "$user_password", "new_password": "$new_password"}',
+                          user_role_change='["user change role $user_name $role_name"]',
+                          user_enable='["user enable $user_name"]',
+                          user_disable='["user disable $user_name"]',
+                          user_default_aging_reset='["user password aging option reset $aging"]',
+                          user_aging_reset='["user password aging reset $user_name $aging"]',
+                          user_default_aging_set='["user password aging option set $aging"]',
+                          user_aging_set='["user password aging set $user_name $aging"]',
+                          user_strength_set='["user password strength reset $strength"]',
+                          user_strength_reset='["user password strength set $strength"]',
+                          user_del='["user del $user_name"]',
+                          user_show_details='["user show detailed $user_name"]',
+                          user_show='["user show list"]'
+                    )
+
+
+def users():
+    return conditions, supported_commands
@@ -1,29 +1,93 @@
 # Copyright ©️ 2022 Dell Inc. or its subsidiaries.
+from collections import OrderedDict
+from functools import lru_cache
 from string import Template
+from ansible.module_utils.common.arg_spec import ArgumentSpecValidator
 from . import dd_connect
 import json
+import time
+
+
+condition_indexes = OrderedDict()
+ITEM_EXCLUDED_KEYS = ['host', 'port', 'username', 'private_key', 'password', 'dd-password', 'output_format', 'items']
+NO_LOG_MASK = 'VALUE_SPECIFIED_IN_NO_LOG_PARAMETER'
+
+
+def condition_index(conditions):
+    # Conditions grouped by their state and option query values. Within a group the most specific ones
+    # come first: more query keys, then more required keys, then declaration order. The index is kept
+    # for the last few conditions dicts seen, so repeated dispatch on one catalogue builds it once.
+    cached = condition_indexes.get(id(conditions))
+    if cached is not None and cached[0] is conditions:
+        return cached[1]
+    index = {}
+    for position, (action, condition) in enumerate(conditions.items()):
+        query = condition['query']
+        rank = (-len(query), -len(condition['req_key']), position)
+        index.setdefault((query.get('state'), query.get('option')), []).append(
+            (rank, action, frozenset(condition['req_key']), tuple(query.items())))
+    for candidates in index.values():
+        candidates.sort()
+    condition_indexes[id(conditions)] = (conditions, index)
+    while len(condition_indexes) > 16:
+        condition_indexes.popitem(last=False)
+    return index
 
 
 def condition_check(conditions, command_build_dict):
-    diff_keys = []
-    action = ''
-    query_out = []
-    for key, value in conditions.items():
-        query_out = []
-        diff_keys = []
-        for obj in conditions[key]['req_key']:
-            if obj not in command_build_dict:
-                diff_keys.append(obj)
-        if len(diff_keys) == 0:
-            for query_key, query_value in conditions[key]['query'].items():
-                if command_build_dict[query_key] == query_value:
-                    query_out.append(True)
-                else:
-                    query_out.append(False)
-            if all(query_out):
-                action = key
-                break
-    return action
+    index = condition_index(conditions)
+    state = command_build_dict.get('state')
+    candidates = index.get((state, None), [])
+    option = command_build_dict.get('option')
+    if isinstance(option, str) and (state, option) in index:
+        candidates = sorted(index[(state, option)] + candidates)
+    for rank, action, req_keys, query in candidates:
+        if req_keys.issubset(command_build_dict) and all(
+                command_build_dict.get(key) == value for key, value in query):
+            return action
+    return ''
+
+
+@lru_cache(maxsize=None)
+def command_tokens(text):
+    # "net create virtual veth$vethid" becomes (('net create virtual veth', 'vethid'), ('', None)): each
+    # literal is followed by the argument to substitute after it, if any.
+    tokens = []
+    last = 0
+    for match in Template.pattern.finditer(text):
+        literal = text[last:match.start()]
+        name = match.group('named') or match.group('braced')
+        if match.group('escaped') is not None:
+            tokens.append((literal + '$', None))
+        elif name:
+            tokens.append((literal, name))
+        else:
+            raise ValueError(f'Invalid placeholder in command template {text!r}')
+        last = match.end()
+    tokens.append((text[last:], None))
+    return tuple(tokens)
+
+
+@lru_cache(maxsize=None)
+def command_spec(template):
+    # A template is read once: a JSON list holds the CLI command run over SSH, a JSON object the REST
+    # payload. Rendering then only joins the tokens with the argument values, nothing is evaluated.
+    parts = json.loads(template)
+    if isinstance(parts, list):
+        return dict(payload=False, parts=tuple(command_tokens(part) for part in parts))
+    return dict(payload=True, parts=tuple((key, command_tokens(value) if isinstance(value, str) else value)
+                                          for key, value in parts.items()))
+
+
+def render_tokens(tokens, arguments):
+    return ''.join([literal if name is None else literal + str(arguments[name]) for literal, name in tokens])
+
+
+def render_command(spec, arguments):
+    if spec['payload']:
+        return dict((key, render_tokens(value, arguments) if isinstance(value, tuple) else value)
+                    for key, value in spec['parts'])
+    return [render_tokens(tokens, arguments) for tokens in spec['parts']]
 
 
 def build_command(action, arg_dict, supported_commands, conditions):
@@ -35,11 +99,10 @@ def build_command(action, arg_dict, supported_commands, conditions):
         key = key.replace("-", "_")
         argument_dict[key] = value
 
-    command_template = Template(supported_commands[action])
-
-    command = eval(command_template.substitute(**argument_dict))
+    spec = command_spec(supported_commands[action])
+    command = render_command(spec, argument_dict)
 
-    if isinstance(eval(supported_commands[action]), list):
+    if not spec['payload']:
         if 'opt_key' in conditions[action]:
             opt_keys = conditions[action]['opt_key']
             for opt_key in opt_keys:
@@ -71,33 +134,299 @@ def build_command(action, arg_dict, supported_commands, conditions):
     return command, will_change, is_filter, header
 
 
-def run_cmd(module, command, is_filter, server, user, port, private_key=None, password=None, header=None):
-    cmd_output = []
-    cmd_out = {}
+def parse_output(action, conditions, output, output_format='structured'):
+    # SSH output is parsed with the action's parser, REST output already arrives as records. Records of an
+    # action that also runs over SSH are laid out as the rows of its table. Anything else (an error) is passed
+    # through untouched. Nothing is parsed when raw output is asked for.
+    # Columnar output is packed from compact rows, the rows themselves never reach exit_json.
+    if isinstance(output, bytes) and output_format in ('raw', 'both'):
+        output = output.decode('utf-8')
+    if output_format == 'raw':
+        return output
+    condition = conditions[action]
+    parsed = output
+    if isinstance(output, (str, bytes)):
+        parsed = dd_connect.parse_output(output, condition.get('parser'), condition['header'], condition.get('types'),
+                                         compact=output_format == 'columnar')
+    elif isinstance(output, list) and condition.get('header') and condition.get('rest'):
+        parsed = dd_connect.record_rows(output, condition['header'], condition['rest'].get('columns'),
+                                        condition.get('types'))
+    if output_format == 'columnar' and isinstance(parsed, list):
+        parsed = dd_connect.columnar_records(parsed)
+    if output_format == 'both':
+        return dict(raw=output, structured=parsed)
+    return parsed
 
-    if isinstance(command, list):
-        cmd = " ".join(
-            str(command).replace("[", "").replace("]", "").replace("'", "").replace(":", "").replace("{", "").replace(
-                "}", "").replace('"', '').split(", "))
-        if 'repl-port' in cmd:
-            cmd = cmd.replace('repl-port', 'port')
-        else:
-            cmd = cmd
-        cmd_output = dd_connect.dd_ssh(server, user, port, cmd, private_key, password, header)
+
+def parses_output(action, conditions):
+    # Single tasks and items parse the output of the same actions, those that declare a parser.
+    return bool(conditions[action].get('parser'))
+
+
+def diff_output(action, conditions, before, after):
+    # Compares two parsed results of the same show action on its declared natural key.
+    key = conditions[action].get('key')
+    if key is None:
+        raise ValueError(f'{action} has no key to diff on')
+    return dd_connect.diff_rows(before, after, key)
+
+
+def rest_request_type(module, is_filter, state=None):
+    state = state or module.params['state']
+    if is_filter is None and state == 'add':
+        return 'post'
+    if is_filter is not None and state == 'change':
+        return 'put'
+    return None
+
+
+def command_transports(action, conditions, command):
+    if action is not None and conditions is not None and 'transports' in conditions[action]:
+        return list(conditions[action]['transports'])
+    return ['ssh'] if isinstance(command, list) else ['rest']
+
+
+def select_transports(server, transports, rest_pass=None):
+    # Usable transports first, fastest measured one leading and declaration order breaking ties. Transports
+    # that are cooling down stay at the end so they are only tried as a last resort.
+    candidates = [t for t in transports if t != 'rest' or rest_pass is not None]
+    if len(candidates) < 2:
+        return candidates
+
+    def rank(transport):
+        latency = dd_connect.transport_latency(server, transport)
+        return latency is None, latency or 0, transports.index(transport)
+
+    ready = sorted([t for t in candidates if dd_connect.transport_available(server, t)], key=rank)
+    return ready + [t for t in candidates if t not in ready]
+
+
+def ssh_command(command):
+    cmd = " ".join(
+        str(command).replace("[", "").replace("]", "").replace("'", "").replace(":", "").replace("{", "").replace(
+            "}", "").replace('"', '').split(", "))
+    if 'repl-port' in cmd:
+        cmd = cmd.replace('repl-port', 'port')
     else:
-        cmd = json.dumps(command)
-        if is_filter is None and module.params['state'] == 'add':
-            cmd_output = dd_connect.dd_requests(server, user, api_pass=module.params['dd-password'], is_filter=is_filter,
-                                                version='v1.0', module='users', request_type='post', payload=cmd)
-
-        elif is_filter is not None and module.params['state'] == 'change':
-            cmd_output = dd_connect.dd_requests(server, user, api_pass=module.params['dd-password'], is_filter=is_filter,
-                                                version='v1.0', module='users', request_type='put', payload=cmd)
-        else:
-            cmd_out['status'] = False
-            cmd_out['output'] = 'Detected RestAPI call but No Condition matched to proceed'
-            cmd_output.append(cmd_out)
+        cmd = cmd
+    return cmd
 
+
+def run_ssh(command, server, user, port, private_key=None, password=None, header=None, decode=True):
+    return dd_connect.dd_ssh(server, user, port, ssh_command(command), private_key, password, header, decode)
+
+
+def stream_rows(command, server, user, port, private_key=None, password=None, header=None, types=None,
+                compact=False):
+    # Parses table output while it arrives over SSH instead of after the whole listing is read.
+    lines = dd_connect.dd_ssh_lines(server, user, port, ssh_command(command), private_key, password)
+    return dd_connect.iter_rows(lines, header, types, compact)
+
+
+def run_rest(module, command, is_filter, server, user, api_pass, rest=None):
+    rest = rest or {}
+    request_type = rest.get('request_type') or rest_request_type(module, is_filter)
+    resource = rest.get('module', 'users')
+    if request_type is None:
+        return dict(failed=True, output='Detected RestAPI call but No Condition matched to proceed')
+    if request_type == 'get' and is_filter is None:
+        try:
+            output = list(dd_connect.dd_paginate(server, user, api_pass, version='v1.0', module=resource))
+            return dict(failed=False, output=output)
+        except Exception as e:
+            return dict(failed=True, output=e)
+    cmd = json.dumps(command) if isinstance(command, dict) else None
+    return dd_connect.dd_requests(server, user, api_pass=api_pass, is_filter=is_filter, version='v1.0',
+                                  module=resource, request_type=request_type, payload=cmd)
+
+
+def run_cmd(module, command, is_filter, server, user, port, private_key=None, password=None, header=None,
+            action=None, conditions=None):
+    # The transport comes from the action's declared "transports" (list templates default to ssh, dict
+    # templates to rest). When more than one is declared the runtime picks by availability and measured
+    # latency and falls back to the next one if the appliance cannot be reached. An action only declares
+    # several when they return the same rows, so the pick never changes the shape of msg. Timings are only
+    # recorded when there was a choice to make.
+    rest_pass = module.params.get('dd-password') or password
+    rest = conditions[action].get('rest') if (action is not None and conditions is not None) else None
+    # Output of table actions is kept as bytes, parse_output reads it without decoding it all first.
+    decode = action is None or conditions is None or conditions[action].get('parser') not in dd_connect.BUFFER_PARSERS
+    transports = select_transports(server, command_transports(action, conditions, command), rest_pass)
+    cmd_output = dict(failed=True, output='No transport available to run the command')
+    for transport in transports:
+        started = time.time()
+        if transport == 'ssh':
+            cmd_output = run_ssh(command, server, user, port, private_key, password, header, decode)
+        else:
+            cmd_output = run_rest(module, command, is_filter, server, user, rest_pass, rest)
+        unreachable = dd_connect.transport_unreachable(cmd_output['output'])
+        if len(transports) > 1:
+            dd_connect.transport_record(server, transport, time.time() - started, failed=unreachable)
+        if not unreachable:
+            break
     return cmd_output
 
 
+def run_bulk_cmd(module, commands, server, user, max_in_flight=8, rest=None, api_pass=None):
+    # commands is a list of (command, is_filter) pairs as returned by build_command for REST actions.
+    # All of them go out over one authenticated session; results keep the order of commands.
+    rest = rest or {}
+    payloads = []
+    is_filters = []
+    request_types = set()
+    for command, is_filter in commands:
+        payloads.append(json.dumps(command))
+        is_filters.append(is_filter)
+        request_types.add(rest.get('request_type') or rest_request_type(module, is_filter))
+    if len(request_types) != 1 or None in request_types:
+        return [dict(failed=True, output='Detected RestAPI call but No Condition matched to proceed')
+                for command in commands]
+    return dd_connect.dd_bulk_requests(server, user, api_pass=api_pass or module.params.get('dd-password'),
+                                       version='v1.0', module=rest.get('module', 'users'),
+                                       request_type=request_types.pop(), payloads=payloads, is_filters=is_filters,
+                                       max_in_flight=max_in_flight)
+
+
+def item_arguments(arg_dict, item):
+    # An item's arguments override the module's for that item. Unset values are dropped, as the modules do
+    # for their own arguments.
+    merged = dict(arg_dict)
+    for key, value in item.items():
+        if isinstance(value, dict):
+            value = dict((k, v) for k, v in value.items() if v is not None)
+        if value is not None:
+            merged[key] = value
+    return merged
+
+
+def item_option(spec):
+    # A module option as an item sub-option: never required and without a default, since whatever an item
+    # leaves out comes from the task's own options.
+    option = dict((key, value) for key, value in spec.items() if key not in ('required', 'default'))
+    if option.get('options'):
+        option['options'] = dict((key, item_option(value)) for key, value in option['options'].items())
+    return option
+
+
+def item_argument(argument_spec):
+    # The items option. Its sub-options are the module's own, so AnsibleModule checks every item and knows
+    # their no_log values before it logs the invocation.
+    return dict(type='list', elements='dict',
+                options=dict((key, item_option(spec)) for key, spec in argument_spec.items()
+                             if key not in ITEM_EXCLUDED_KEYS))
+
+
+def item_spec(module):
+    return dict((key, spec) for key, spec in module.argument_spec.items() if key not in ITEM_EXCLUDED_KEYS)
+
+
+def item_echo(spec, item, no_log_values):
+    # The item as it is reported back, with the values of no_log options (sub-options included) masked.
+    # Those values are also added to no_log_values, so exit_json masks them in the invocation as well.
+    echo = {}
+    for key, value in item.items():
+        options = spec.get(key) or {}
+        if options.get('no_log') and value is not None:
+            no_log_values.add(str(value))
+            value = NO_LOG_MASK
+        elif isinstance(value, dict) and options.get('options'):
+            value = item_echo(options['options'], value, no_log_values)
+        echo[key] = value
+    return echo
+
+
+def item_validate(spec, item_args):
+    # The module's own checks (types, choices, sub-options) on one merged item, which gets the converted
+    # values back. Returns the arguments and the list of problems, empty when the item is valid.
+    result = ArgumentSpecValidator(spec).validate(dict((k, v) for k, v in item_args.items() if k in spec))
+    if result.error_messages:
+        return item_args, result.error_messages
+    validated = dict(item_args)
+    for key, value in result.validated_parameters.items():
+        if isinstance(value, dict):
+            value = dict((k, v) for k, v in value.items() if v is not None)
+        if value is None:
+            validated.pop(key, None)
+        else:
+            validated[key] = value
+    return validated, []
+
+
+def item_result(item, action, will_change, cmd_output, conditions, output_format):
+    output = cmd_output['output']
+    if isinstance(output, Exception):
+        output = str(output)
+    elif not cmd_output['failed'] and parses_output(action, conditions):
+        output = parse_output(action, conditions, output, output_format)
+    elif isinstance(output, bytes):
+        output = output.decode('utf-8')
+    return dict(item=item, action=action, failed=cmd_output['failed'],
+                changed=will_change and not cmd_output['failed'], output=output)
+
+
+def run_items(module, arg_dict, items, conditions, supported_commands, server, user, port, private_key=None,
+              password=None, output_format='raw', command_hook=None):
+    # Batch mode: one command per item, built from the module arguments with the item's laid over them.
+    # Every SSH command runs over one connection and REST commands over one session per action, instead of
+    # a module run per item. Returns the per item results in item order, whether any changed and any failed.
+    # command_hook(action, command) is the module's own fix up of a built command, if it has one.
+    rest_pass = module.params.get('dd-password') or password
+    spec = item_spec(module)
+    results = [None] * len(items)
+    ssh_jobs = []
+    rest_jobs = {}
+    for position, raw_item in enumerate(items):
+        # AnsibleModule fills the sub-options an item leaves out with None, they are not part of the item.
+        raw_item = item_arguments({}, raw_item)
+        item = item_echo(spec, raw_item, module.no_log_values)
+        unknown = [key for key in raw_item if key not in spec]
+        if unknown:
+            results[position] = dict(item=item, failed=True, changed=False,
+                                     output=f'Unsupported item keys: {", ".join(sorted(unknown))}')
+            continue
+        item_args, problems = item_validate(spec, item_arguments(arg_dict, raw_item))
+        if problems:
+            results[position] = dict(item=item, failed=True, changed=False, output='; '.join(problems))
+            continue
+        action = condition_check(conditions, item_args)
+        if not action:
+            results[position] = dict(item=item, failed=True, changed=False,
+                                     output='No condition matched the item arguments')
+            continue
+        try:
+            command, will_change, is_filter, header = build_command(action, item_args, supported_commands,
+                                                                    conditions)
+        except (KeyError, ValueError) as e:
+            results[position] = dict(item=item, action=action, failed=True, changed=False,
+                                     output=f'Could not build the command: missing or invalid {e}')
+            continue
+        if command_hook is not None:
+            command = command_hook(action, command)
+        # Items share one SSH connection, so an action that can run over SSH does.
+        transports = [t for t in command_transports(action, conditions, command) if t != 'rest' or rest_pass]
+        if not transports:
+            results[position] = dict(item=item, action=action, failed=True, changed=False,
+                                     output='No transport available to run the command')
+        elif 'ssh' in transports:
+            ssh_jobs.append((position, item, action, will_change, ssh_command(command)))
+        else:
+            rest_jobs.setdefault(action, []).append((position, item, will_change, command, is_filter))
+
+    if ssh_jobs:
+        outputs = dd_connect.dd_ssh_batch(server, user, port, [job[4] for job in ssh_jobs], private_key, password)
+        for (position, item, action, will_change, command), cmd_output in zip(ssh_jobs, outputs):
+            results[position] = item_result(item, action, will_change, cmd_output, conditions, output_format)
+
+    for action, jobs in rest_jobs.items():
+        # The action's query fixes the state, so the request type is the same for all of its items.
+        rest = dict(conditions[action].get('rest') or {})
+        if not rest.get('request_type'):
+            rest['request_type'] = rest_request_type(module, jobs[0][4], conditions[action]['query']['state'])
+        outputs = run_bulk_cmd(module, [(job[3], job[4]) for job in jobs], server, user, rest=rest,
+                               api_pass=rest_pass)
+        for (position, item, will_change, command, is_filter), cmd_output in zip(jobs, outputs):
+            results[position] = item_result(item, action, will_change, cmd_output, conditions, output_format)
+
+    changed = any(result['changed'] for result in results)
+    failed = any(result['failed'] for result in results)
+    return results, changed, failed
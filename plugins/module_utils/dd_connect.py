@@ -1,10 +1,17 @@
 # Copyright ©️ 2022 Dell Inc. or its subsidiaries.
+import hashlib
 import json
 import os
+import shutil
+import socket
+import tempfile
+import threading
 import time
 import urllib3
 urllib3.disable_warnings()
-import re
+from concurrent.futures import ThreadPoolExecutor
+from .dd_parser import (BUFFER_PARSERS, columnar_records, diff_rows, flatten_record, iter_rows, parse_output,
+                        record_rows, tab_to_json)
 
 try:
     import paramiko
@@ -13,28 +20,115 @@ try:
 except ImportError as e:
     import_error = e
     imported_modules = False
+
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
 #
 # from ansible.parsing.dataloader import DataLoader
 # from ansible.inventory.manager import InventoryManager
 
 command_outout = {}
 final_output = []
+REST_PORT = 3009
+REST_CACHE_TTL = int(os.environ.get('DD_REST_CACHE_TTL', 30))
+REST_CACHE_DIR = os.environ.get('DD_REST_CACHE_DIR')
+rest_cache = {}
+rest_logins = set()
+TRANSPORT_STATS_FILE = os.environ.get('DD_TRANSPORT_STATS',
+                                      os.path.join(tempfile.gettempdir(), 'dd_transport_stats.json'))
+TRANSPORT_COOLDOWN = 60
+transport_stats = {}
+transport_lock = threading.Lock()
+
+
+def load_transport_stats():
+    if not transport_stats and TRANSPORT_STATS_FILE:
+        try:
+            with open(TRANSPORT_STATS_FILE) as f:
+                transport_stats.update(json.load(f))
+        except (OSError, ValueError):
+            pass
+    return transport_stats
+
+
+def transport_available(server, transport):
+    # A transport is skipped while it is cooling down after the appliance could not be reached over it.
+    stats = load_transport_stats().get(f'{server}|{transport}', {})
+    return stats.get('down_until', 0) <= time.time()
+
+
+def transport_latency(server, transport):
+    return load_transport_stats().get(f'{server}|{transport}', {}).get('latency')
+
 
+def transport_unreachable(error):
+    # Only a failure to reach the appliance says anything about the transport. A command that ran and
+    # failed, or credentials the appliance refused, leave it in rotation.
+    if not isinstance(error, Exception):
+        return False
+    if imported_modules:
+        if isinstance(error, paramiko.AuthenticationException):
+            return False
+        if isinstance(error, (paramiko.SSHException, paramiko.ssh_exception.NoValidConnectionsError,
+                              requests.ConnectionError, requests.Timeout)):
+            return True
+    return isinstance(error, (ConnectionError, socket.timeout, socket.gaierror))
 
-def dd_ssh(server, user, port, command, private_key=None, password=None, header=None):
+
+def transport_record(server, transport, elapsed, failed=False):
+    # Forks of other tasks write the same file. It is read again right before writing, so their entries
+    # are kept, and replaced by a rename, so a reader never sees a half written file.
+    with transport_lock:
+        if TRANSPORT_STATS_FILE:
+            try:
+                with open(TRANSPORT_STATS_FILE) as f:
+                    transport_stats.update(json.load(f))
+            except (OSError, ValueError):
+                pass
+        stats = transport_stats.setdefault(f'{server}|{transport}', {})
+        if failed:
+            stats['down_until'] = time.time() + TRANSPORT_COOLDOWN
+        else:
+            latency = stats.get('latency')
+            stats['latency'] = elapsed if latency is None else 0.7 * latency + 0.3 * elapsed
+            stats.pop('down_until', None)
+        if TRANSPORT_STATS_FILE:
+            temp = None
+            try:
+                fd, temp = tempfile.mkstemp(dir=os.path.dirname(os.path.abspath(TRANSPORT_STATS_FILE)),
+                                            suffix='.tmp')
+                with os.fdopen(fd, 'w') as f:
+                    json.dump(transport_stats, f)
+                os.replace(temp, TRANSPORT_STATS_FILE)
+            except (OSError, TypeError, ValueError):
+                if temp is not None and os.path.exists(temp):
+                    os.remove(temp)
+
+
+def ssh_connect(server, user, port, private_key=None, password=None):
     client = paramiko.SSHClient()
     client.set_missing_host_key_policy(paramiko.AutoAddPolicy())
+    if private_key is not None:
+        k = paramiko.RSAKey.from_private_key_file(private_key)
+        client.connect(hostname=server, username=user, pkey=k, port=port)
+    if password is not None:
+        k = password
+        client.connect(hostname=server, username=user, password=k, port=port)
+    return client
+
+
+def dd_ssh(server, user, port, command, private_key=None, password=None, header=None, decode=True):
+    # decode=False hands stdout back as bytes, for output going straight to parse_output's buffer path.
     try:
-        if private_key is not None:
-            k = paramiko.RSAKey.from_private_key_file(private_key)
-            client.connect(hostname=server, username=user, pkey=k, port=port)
-        if password is not None:
-            k = password
-            client.connect(hostname=server, username=user, password=k, port=port)
+        client = ssh_connect(server, user, port, private_key, password)
         stdin, stdout, stderr = client.exec_command(command)
         outerr = stderr.read().decode('utf-8')
-        output = stdout.read().decode('utf-8')
-        # output = tab_to_json(output=output, header=header)
+        output = stdout.read()
+        if decode:
+            output = output.decode('utf-8')
         cmd_status = stdout.channel.recv_exit_status()
         if cmd_status == 0:
             command_outout['failed'] = False
@@ -48,48 +142,230 @@ def dd_ssh(server, user, port, command, private_key=None, password=None, header=
     return command_outout
 
 
+def dd_ssh_batch(server, user, port, commands, private_key=None, password=None, decode=True):
+    # Runs the commands one after the other over a single connection, a channel each, and returns one
+    # dd_ssh style result per command. When the connection itself fails every command fails with it.
+    try:
+        client = ssh_connect(server, user, port, private_key, password)
+    except Exception as e:
+        return [dict(failed=True, output=e) for command in commands]
+    results = []
+    try:
+        for command in commands:
+            try:
+                stdin, stdout, stderr = client.exec_command(command)
+                output = stdout.read()
+                outerr = stderr.read().decode('utf-8')
+                if decode:
+                    output = output.decode('utf-8')
+                failed = stdout.channel.recv_exit_status() != 0
+                results.append(dict(failed=failed, output=outerr if failed else output))
+            except Exception as e:
+                results.append(dict(failed=True, output=e))
+    finally:
+        client.close()
+    return results
+
+
+def dd_ssh_lines(server, user, port, command, private_key=None, password=None):
+    # Yields stdout line by line while the command is still running. A failing command raises
+    # RuntimeError with its stderr once the output is drained.
+    client = ssh_connect(server, user, port, private_key, password)
+    try:
+        stdin, stdout, stderr = client.exec_command(command)
+        for line in stdout:
+            yield line
+        if stdout.channel.recv_exit_status() != 0:
+            raise RuntimeError(stderr.read().decode('utf-8'))
+    finally:
+        client.close()
+
+
+def json_loads(data):
+    if HAS_ORJSON:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def decode_body(body):
+    # REST responses are handed back as decoded structures; bodies that are not JSON stay text.
+    if not body:
+        return ''
+    try:
+        return json_loads(body)
+    except ValueError:
+        return body.decode('utf-8', 'replace') if isinstance(body, bytes) else body
+
+
+def rest_url(server, version, module, is_filter=None):
+    if is_filter is None:
+        return f"https://{server}:{REST_PORT}/rest/{version}/dd-systems/0/{module}"
+    return f"https://{server}:{REST_PORT}/rest/{version}/dd-systems/0/{module}/{is_filter}"
+
+
+def dd_auth(server, user, api_pass, session=None):
+    if session is None:
+        session = requests
+    url = f"https://{server}:{REST_PORT}/rest/v1.0/auth"
+    headers = {'Content-Type': "application/json"}
+    data = """\
+            {"auth_info":{"username":"%s","password":"%s"}}\
+            """ % (user, api_pass)
+    r = session.post(url, headers=headers, verify=False, auth=(user, api_pass), data=data)
+    if 'X-DD-AUTH-TOKEN' in r.headers:
+        return r.headers['X-DD-AUTH-TOKEN']
+    data = json.dumps({
+            "username": user,
+            "password": api_pass
+        })
+    r = session.post(url, headers=headers, verify=False, data=data)
+    if 'X-DD-AUTH-TOKEN' in r.headers:
+        return r.headers['X-DD-AUTH-TOKEN']
+    raise PermissionError(f"Authentication to {server} failed with status {r.status_code}")
+
+
+def login_key(server, user, api_pass):
+    return server, user, hashlib.sha256(f"{user}\0{api_pass}".encode('utf-8')).hexdigest()
+
+
+def token_auth(server, user, api_pass):
+    # Logs in on the first request that actually goes out and every request of the session then carries that
+    # one token. logged_in() tells rest_get whether these credentials were accepted earlier in this process.
+    token = []
+    lock = threading.Lock()
+    login = login_key(server, user, api_pass)
+
+    def auth(request):
+        with lock:
+            if not token:
+                token.append(dd_auth(server, user, api_pass))
+                rest_logins.add(login)
+        request.headers['X-DD-AUTH-TOKEN'] = token[0]
+        return request
+    auth.logged_in = lambda: login in rest_logins
+    return auth
+
+
+def rest_session(server, user, api_pass, pool_size=10):
+    session = requests.Session()
+    adapter = requests.adapters.HTTPAdapter(pool_connections=1, pool_maxsize=pool_size)
+    session.mount('https://', adapter)
+    session.verify = False
+    session.auth = token_auth(server, user, api_pass)
+    session.headers.update({
+        'Content-Type': "application/json",
+        'Accept': 'application/json'
+    })
+    return session
+
+
+def cache_key(server, version, module, user=None, is_filter=None, params=None):
+    return server, version, module, user, is_filter, tuple(sorted((params or {}).items()))
+
+
+def cache_path(key):
+    slot = '|'.join([str(key[0]), str(key[1]), key[2].split('/')[0]])
+    slot = hashlib.sha1(slot.encode('utf-8')).hexdigest()
+    name = hashlib.sha1(repr(key[3:]).encode('utf-8')).hexdigest()
+    return os.path.join(REST_CACHE_DIR, slot), name + '.json'
+
+
+def cache_lookup(key):
+    entry = rest_cache.get(key)
+    if entry is None and REST_CACHE_DIR:
+        slot, name = cache_path(key)
+        try:
+            with open(os.path.join(slot, name)) as f:
+                entry = json.load(f)
+            rest_cache[key] = entry
+        except (OSError, ValueError):
+            entry = None
+    return entry
+
+
+def cache_store(key, entry):
+    # Cached responses are only readable by the controller user, the file is written next to its final
+    # name and moved into place so a concurrent task never reads half of it.
+    rest_cache[key] = entry
+    if REST_CACHE_DIR:
+        slot, name = cache_path(key)
+        temp = None
+        try:
+            os.makedirs(slot, mode=0o700, exist_ok=True)
+            fd, temp = tempfile.mkstemp(dir=slot, suffix='.tmp')
+            with os.fdopen(fd, 'w') as f:
+                json.dump(entry, f)
+            os.replace(temp, os.path.join(slot, name))
+        except (OSError, TypeError, ValueError):
+            if temp is not None and os.path.exists(temp):
+                os.remove(temp)
+
+
+def cache_invalidate(server, version, module):
+    # Any write to a resource drops every cached read of it, whatever filter or page it was read with.
+    module = module.split('/')[0]
+    for key in [k for k in rest_cache if k[:2] == (server, version) and k[2].split('/')[0] == module]:
+        rest_cache.pop(key, None)
+    if REST_CACHE_DIR:
+        shutil.rmtree(cache_path((server, version, module))[0], ignore_errors=True)
+
+
+def rest_get(session, server, version, module, is_filter=None, params=None, headers=None, ttl=None, user=None):
+    # GET with a TTL cache keyed by (host, version, resource, user, filter). Stale entries are revalidated with
+    # If-None-Match / If-Modified-Since when the appliance sent an ETag or Last-Modified header. A fresh entry
+    # is only served once the session's credentials have logged in within this process, until then it is
+    # revalidated like a stale one so the appliance checks them.
+    ttl = REST_CACHE_TTL if ttl is None else ttl
+    url = rest_url(server, version, module, is_filter)
+    headers = dict(headers or {})
+    if ttl <= 0:
+        response = session.get(url, headers=headers, verify=False, params=params)
+        return response.status_code, response.content
+    key = cache_key(server, version, module, user, is_filter, params)
+    entry = cache_lookup(key)
+    now = time.time()
+    logged_in = getattr(session.auth, 'logged_in', None)
+    if entry is not None and entry['expires'] > now and logged_in is not None and logged_in():
+        return entry['status'], entry['text']
+    if entry is not None:
+        if entry.get('etag'):
+            headers['If-None-Match'] = entry['etag']
+        if entry.get('last_modified'):
+            headers['If-Modified-Since'] = entry['last_modified']
+    response = session.get(url, headers=headers, verify=False, params=params)
+    if response.status_code == 304 and entry is not None:
+        entry['expires'] = now + ttl
+        cache_store(key, entry)
+        return entry['status'], entry['text']
+    if response.status_code == 200:
+        cache_store(key, dict(status=200, text=response.text, expires=now + ttl,
+                              etag=response.headers.get('ETag'),
+                              last_modified=response.headers.get('Last-Modified')))
+    return response.status_code, response.content
+
+
 def dd_requests(server, user, api_pass, is_filter, version, module, request_type, payload):
     try:
-        url = f"https://{server}:3009/rest/v1.0/auth"
-
-        headers = {'Content-Type': "application/json"
-                                   }
-        data = """\
-                {"auth_info":{"username":"%s","password":"%s"}}\
-                """ % (user, api_pass)
-        # data = json.loads(data)
-        r = requests.post(url, headers=headers, verify=False, auth=(user, api_pass), data=data)
-        if 'X-DD-AUTH-TOKEN' in r.headers:
-            dd_auth_token = r.headers['X-DD-AUTH-TOKEN']
-        else:
-            data = json.dumps({
-                    "username": user,
-                    "password": api_pass
-                })
-
-            r = requests.post(url, headers=headers, verify=False, data=data)
-            if 'X-DD-AUTH-TOKEN' in r.headers:
-                dd_auth_token = r.headers['X-DD-AUTH-TOKEN']
-            # payload = json.dumps(payload)
-
-        headers = {
-            'X-DD-AUTH-TOKEN': dd_auth_token,
-            'Content-Type': "application/json",
-            'Accept': 'application/text'
-        }
-
-        if is_filter is None:
-            url = f"https://{server}:3009/rest/{version}/dd-systems/0/{module}"
-        else:
-            url = f"https://{server}:3009/rest/{version}/dd-systems/0/{module}/{is_filter}"
-        response = requests.request(f"{request_type}", url, headers=headers, verify=False, data=payload)
+        session = rest_session(server, user, api_pass, pool_size=1)
+        try:
+            if request_type.lower() == 'get':
+                status_code, body = rest_get(session, server, version, module, is_filter, user=user)
+            else:
+                url = rest_url(server, version, module, is_filter)
+                try:
+                    response = session.request(f"{request_type}", url, verify=False, data=payload)
+                finally:
+                    cache_invalidate(server, version, module)
+                status_code, body = response.status_code, response.content
+        finally:
+            session.close()
         success_service = [200, 201]
-        if int(response.status_code) in success_service:
+        if int(status_code) in success_service:
             command_outout['failed'] = False
-            command_outout['output'] = response.text
+            command_outout['output'] = decode_body(body)
         else:
             command_outout['failed'] = True
-            command_outout['output'] = response.text
+            command_outout['output'] = decode_body(body)
     except Exception as e:
         command_outout['failed'] = True
         command_outout['output'] = e
@@ -97,213 +373,117 @@ def dd_requests(server, user, api_pass, is_filter, version, module, request_type
     return command_outout
 
 
-def tab_to_json(output, header=None):
-    final_data = []
-    if "--" in str(output) and "Option" not in str(output) and '- share' not in str(output):
-        commandOut = output.split('\n')
-        lookup = "--"
-        i = 0
-        p = 0
-        out = {}
-        data_frames = []
-        for line in commandOut:
-            i += 1
-            if lookup in line:
-                out[p] = i - 1
-                p += 1
-        p = 0
-        total_lines = len(out) - 1
-        if total_lines == 0:
-            out[1] = out[0] + 2
-            total_lines = 1
-        while p < total_lines:
-            start_line = out[p] + 1
-            p += 1
-            end_line = out[p]
-            data_frames.append(commandOut[start_line:end_line])
-        for line in data_frames:
-            for l in line:
-                data = {}
-                obj = re.split('\s\s\s+', l.strip())
-                i = 0
-                if len(obj) >= (len(header) - 1):
-                    for o in obj:
-                        data[header[i]] = o
-                        i = i + 1
-                    final_data.append(data)
-        return final_data
-    elif "Option" in str(output) and 'Value' in str(output):
-        cmdOutput = output.split('\n\n')
-        for section in cmdOutput:
-            data = {}
-            section = section.strip()
-            lines = section.split('\n')
-
-            if ':' in lines[0]:
-                mkey = lines[0].strip().replace(':', '')
-                data[mkey] = {}
-                for line in lines[1:]:
-                    if '--' not in line and 'Option' not in line:
-                        key, value = re.split('\s\s+', line.strip())
-                        data[mkey][key] = value
-                final_data.append(data)
+def page_items(page, key=None):
+    if key is not None:
+        return page.get(key) or []
+    for name, value in page.items():
+        if name != 'paging_info' and isinstance(value, list):
+            return value
+    return []
+
+
+def dd_paginate(server, user, api_pass, version, module, page_size=100, prefetch=False, is_filter=None,
+                params=None, key=None, session=None):
+    # Walks the paging_info of a DDOS REST list endpoint and yields one object at a time, so callers
+    # can filter or aggregate huge collections without holding every page in memory.
+    owned = session is None
+    if owned:
+        session = rest_session(server, user, api_pass, pool_size=2)
+    headers = {'Accept': 'application/json'}
+    query = dict(params or {})
+    query['size'] = page_size
+
+    def fetch(page):
+        # Pages are read once, keeping them would only grow rest_cache with every page of the collection.
+        status_code, body = rest_get(session, server, version, module, is_filter, params=dict(query, page=page),
+                                     headers=headers, ttl=0)
+        if int(status_code) != 200:
+            raise requests.HTTPError(f"{status_code} listing {module}: {decode_body(body)}")
+        return json_loads(body)
+
+    executor = ThreadPoolExecutor(max_workers=1) if prefetch else None
+    try:
+        page = 0
+        seen = 0
+        current = fetch(page)
+        while True:
+            items = page_items(current, key)
+            paging_info = current.get('paging_info') or {}
+            # The appliance may clamp the page size below the one asked for, so the next page is decided by
+            # what paging_info says was served, not by the requested size.
+            page = int(paging_info.get('current_page', page))
+            seen += int(paging_info.get('page_entries', len(items)))
+            if 'total_entries' in paging_info:
+                has_next = bool(items) and seen < int(paging_info['total_entries'])
             else:
-                mkeys = re.split('\s\s+', lines[0].strip())
-                if 'Option' in mkeys:
-
-                    for line in lines[1:]:
-
-                        if '--' not in line and len(line) > 0:
-                            data = {}
-                            key, value = re.split('\s\s+', line.strip())
-                            data[key] = value
-                            final_data.append(data)
-                else:
-                    for line in lines[1:]:
-                        data = {}
-                        if '--' not in line and 'Option' not in line:
-                            values = re.split('\s\s+', line.strip())
-                            i = 0
-                            for value in values:
-                                data[mkeys[i]] = value
-                                i += 1
-                            final_data.append(data)
-        return final_data
-    elif ': ' in str(output):
-        cmdOutput = output.split('\n\n')
-        for line in cmdOutput:
-            if len(line.strip()) > 0:
-                obj = line.split('\n')
-                data = {}
-                for o in obj:
-                    if ":" in o:
-                        key, value = o.split(":", 1)
-
-                        if len(value.strip()) > 0:
-                            data[key.strip().lower().replace(' ', '_')] = value.strip()
-                        else:
-                            data[key.strip().lower().replace(' ', '_')] = []
-                    else:
-                        if len(o) > 0 and '*' not in o:
-                            try:
-                                key, value = re.split('\s\s+', o.strip())
-                                data[key.lower().replace(' ', '_')] = value.strip()
-                            except Exception as e:
-                                # print(e)
-                                pass
-
-                final_data.append(data)
-        return final_data
-    else:
-        data = {}
-        data['output'] = []
-        cmdOutput = output.split('\n')
-        for line in cmdOutput:
-            if len(line) > 0:
-                data['output'].append(line)
-        final_data.append(data)
-        return final_data
-
-# def tab_to_json(output, header=None):
-#     final_data = []
-#     if "--" in str(output) and "Option" not in str(output) and 'Value' not in str(output):
-#         commandOut = output.split('\n')
-#         lookup = "--"
-#         i = 0
-#         p = 0
-#         out = {}
-#         data_frames = []
-#         for line in commandOut:
-#             i += 1
-#             if lookup in line:
-#                 out[p] = i - 1
-#                 p += 1
-#         p = 0
-#         total_lines = len(out) - 1
-#         while p < total_lines:
-#             start_line = out[p] + 1
-#             p += 1
-#             end_line = out[p]
-#             data_frames.append(commandOut[start_line:end_line])
-#         for line in data_frames:
-#             for l in line:
-#                 data = {}
-#                 obj = re.split('\s\s\s+', l.strip())
-#                 i = 0
-
-#                 for o in obj:
-#                     data[header[i]] = o
-#                     i = i + 1
-#                 final_data.append(data)
-#         return final_data
-#     elif "Option" in str(output) and 'Value' in str(output):
-#         cmdOutput = output.split('\n\n')
-#         for section in cmdOutput:
-#             data = {}
-#             section = section.strip()
-#             lines = section.split('\n')
-
-#             if ':' in lines[0]:
-#                 mkey = lines[0].strip().replace(':', '')
-#                 data[mkey] = {}
-#                 for line in lines[1:]:
-#                     if '--' not in line and 'Option' not in line:
-#                         key, value = re.split('\s\s+', line.strip())
-#                         data[mkey][key] = value
-#                 final_data.append(data)
-#             else:
-#                 mkeys = re.split('\s\s+', lines[0].strip())
-#                 if 'Option' in mkeys:
-
-#                     for line in lines[1:]:
-
-#                         if '--' not in line and len(line) > 0:
-#                             data = {}
-#                             key, value = re.split('\s\s+', line.strip())
-#                             data[key] = value
-#                             final_data.append(data)
-#                 else:
-#                     for line in lines[1:]:
-#                         data = {}
-#                         if '--' not in line and 'Option' not in line:
-#                             values = re.split('\s\s+', line.strip())
-#                             i = 0
-#                             for value in values:
-#                                 data[mkeys[i]] = value
-#                                 i += 1
-#                             final_data.append(data)
-#         return final_data
-#     elif ': ' in str(output):
-#         cmdOutput = output.split('\n\n')
-#         for line in cmdOutput:
-#             if len(line.strip()) > 0:
-#                 obj = line.split('\n')
-#                 data = {}
-#                 for o in obj:
-#                     if ":" in o:
-#                         key, value = o.split(":", 1)
-
-#                         if len(value.strip()) > 0:
-#                             data[key.strip()] = value.strip()
-#                         else:
-#                             data[key.strip()] = []
-#                     else:
-#                         if len(o) > 0 and '*' not in o:
-#                             try:
-#                                 key, value = re.split('\s\s+', o.strip())
-#                                 data[key] = value.strip()
-#                             except Exception as e:
-#                                 # print(e)
-#                                 pass
-
-#                 final_data.append(data)
-#         return final_data
-#     else:
-#         data = {}
-#         data['output'] = []
-#         cmdOutput = output.split('\n')
-#         for line in cmdOutput:
-#             if len(line) > 0:
-#                 data['output'].append(line)
-#         final_data.append(data)
-#         return final_data
+                has_next = len(items) >= page_size
+            pending = executor.submit(fetch, page + 1) if (has_next and executor is not None) else None
+            for item in items:
+                yield item
+            if not has_next:
+                break
+            page += 1
+            current = pending.result() if pending is not None else fetch(page)
+    finally:
+        if executor is not None:
+            executor.shutdown(wait=False)
+        if owned:
+            session.close()
+
+
+def dd_stats(server, user, api_pass, module, start=None, end=None, interval=None, data_view=None, page_size=500,
+             version='v1.0'):
+    filters = []
+    if start is not None:
+        filters.append(f'collection_epoch>={int(start)}')
+    if end is not None:
+        filters.append(f'collection_epoch<={int(end)}')
+    params = {}
+    if filters:
+        params['filter'] = ' and '.join(filters)
+    if interval is not None:
+        params['interval'] = interval
+    if data_view is not None:
+        params['data_view'] = data_view
+    records = dd_paginate(server, user, api_pass, version=version, module=module, page_size=page_size,
+                          prefetch=True, params=params)
+    return columnar_records(records)
+
+
+def dd_bulk_requests(server, user, api_pass, version, module, request_type, payloads, is_filters=None,
+                     max_in_flight=8):
+    # One authenticated session shared by every payload, with at most max_in_flight requests on the
+    # wire at once. Results come back in the same order as payloads.
+    if is_filters is None:
+        is_filters = [None] * len(payloads)
+    try:
+        session = rest_session(server, user, api_pass, pool_size=max_in_flight)
+    except Exception as e:
+        return [dict(failed=True, output=e) for payload in payloads]
+
+    def send(item):
+        payload, is_filter = item
+        if not isinstance(payload, str):
+            payload = json.dumps(payload)
+        result = {}
+        try:
+            if request_type.lower() == 'get':
+                status_code, body = rest_get(session, server, version, module, is_filter, user=user)
+            else:
+                url = rest_url(server, version, module, is_filter)
+                response = session.request(f"{request_type}", url, verify=False, data=payload)
+                status_code, body = response.status_code, response.content
+            result['failed'] = int(status_code) not in [200, 201]
+            result['output'] = decode_body(body)
+        except Exception as e:
+            result['failed'] = True
+            result['output'] = e
+        return result
+
+    try:
+        with ThreadPoolExecutor(max_workers=max(1, max_in_flight)) as executor:
+            return list(executor.map(send, zip(payloads, is_filters)))
+    finally:
+        if request_type.lower() != 'get':
+            cache_invalidate(server, version, module)
+        session.close()
@@ -0,0 +1,97 @@
+# Copyright ©️ 2022 Dell Inc. or its subsidiaries.
+from . import dd_parser
+
+try:
+    import numpy as np
+    HAS_NUMPY = True
+except ImportError:
+    HAS_NUMPY = False
+
+INTEGER_KINDS = ['size', 'gib', 'int']
+FLOAT_KINDS = ['float', 'percent', 'factor']
+
+
+def column_array(values, kind=None):
+    # Byte sizes and counts become int64, ratios float64. Cells that did not convert ('-', empty) count as
+    # 0 in integer columns and NaN in float columns, so they drop out of nansum/nanmean.
+    if kind in INTEGER_KINDS:
+        return np.fromiter((v if type(v) is int else 0 for v in values), dtype=np.int64, count=len(values))
+    if kind in FLOAT_KINDS:
+        return np.fromiter((v if type(v) in (int, float) else np.nan for v in values), dtype=np.float64,
+                           count=len(values))
+    return np.array(values, dtype=object)
+
+
+def record_columns(records):
+    if isinstance(records, dict):
+        return records
+    return dd_parser.columnar_records(records)
+
+
+def to_arrays(records, types):
+    # Accepts converted rows or columnar output and returns one numpy array per column.
+    return dict((key, column_array(values, types.get(key))) for key, values in record_columns(records).items())
+
+
+def parse_arrays(output, parser=None, header=None, types=None):
+    types = types or {}
+    return to_arrays(dd_parser.parse_output(output, parser, header, types), types)
+
+
+def fleet_arrays(results, types, label='host'):
+    # results maps an appliance to its rows. The per appliance columns are concatenated once and the
+    # appliance name is added as a column to group by. Appliances need not report the same columns: every
+    # column of any of them is kept, and rows of an appliance without it get empty cells, 0 or NaN by kind.
+    appliances = []
+    keys = {}
+    for name, records in results.items():
+        columns = record_columns(records)
+        appliances.append((name, len(next(iter(columns.values()), [])), columns))
+        keys.update(dict.fromkeys(columns))
+    arrays = {}
+    for key in keys:
+        arrays[key] = np.concatenate([column_array(columns[key] if key in columns else [None] * size, types.get(key))
+                                      for name, size, columns in appliances])
+    names = [np.full(size, name, dtype=object) for name, size, columns in appliances]
+    arrays[label] = np.concatenate(names) if names else np.array([], dtype=object)
+    return arrays
+
+
+def mask_rows(arrays, column, value):
+    if column not in arrays:
+        return dict((key, array[:0]) for key, array in arrays.items())
+    keep = arrays[column] == value
+    return dict((key, array[keep]) for key, array in arrays.items())
+
+
+def column_total(array):
+    if array.dtype.kind == 'f':
+        return float(np.nansum(array))
+    return int(array.sum())
+
+
+def totals(arrays, columns):
+    return dict((column, column_total(arrays[column]) if column in arrays else 0) for column in columns)
+
+
+def group_totals(arrays, by, columns):
+    # One np.unique and one np.add.at per column, whatever the number of groups.
+    groups, index = np.unique(arrays[by].astype(str), return_inverse=True)
+    result = dict((group, {}) for group in groups.tolist())
+    for column in [column for column in columns if column in arrays]:
+        values = arrays[column]
+        if values.dtype.kind == 'f':
+            values = np.nan_to_num(values)
+        sums = np.zeros(len(groups), dtype=values.dtype)
+        np.add.at(sums, index, values)
+        for group, total in zip(groups.tolist(), sums.tolist()):
+            result[group][column] = total
+    return result
+
+
+def ratio(numerator, denominator):
+    numerator = np.asarray(numerator, dtype=np.float64)
+    denominator = np.asarray(denominator, dtype=np.float64)
+    out = np.full(np.broadcast(numerator, denominator).shape, np.nan)
+    np.divide(numerator, denominator, out=out, where=denominator != 0)
+    return out
@@ -0,0 +1,584 @@
+# Copyright ©️ 2022 Dell Inc. or its subsidiaries.
+import calendar
+import hashlib
+import json
+import keyword
+import os
+import re
+import sys
+import tempfile
+import time
+from collections import OrderedDict
+from collections.abc import Mapping
+from functools import lru_cache
+from itertools import chain, repeat
+from operator import attrgetter, itemgetter
+
+SEPARATOR_LINE = re.compile(r'^\s*--[\s-]*$')
+DASH_RUN = re.compile(r'-+')
+WIDE_GAP = re.compile(r'\s\s\s+')
+GAP = re.compile(r'\s\s+')
+BOUNDARY = re.compile(r'\n([ \t]*(?:--[ \t-]*)?)\r?(?=\n|$)')
+BUFFER_BOUNDARY = re.compile(BOUNDARY.pattern.encode())
+BUFFER_FIRST_LINE = re.compile(rb'([ \t]*--[ \t-]*)\r?(?=\n|$)')
+SIZE = re.compile(r'^([\d.,]+)\s*([KMGTPE]i?B|B)?$', re.IGNORECASE)
+UNITS = dict(b=1, kb=10 ** 3, mb=10 ** 6, gb=10 ** 9, tb=10 ** 12, pb=10 ** 15, eb=10 ** 18,
+             kib=2 ** 10, mib=2 ** 20, gib=2 ** 30, tib=2 ** 40, pib=2 ** 50, eib=2 ** 60)
+TIME_FORMATS = ['%a %b %d %H:%M:%S %Y', '%a %b %d %H:%M %Y', '%Y/%m/%d %H:%M:%S', '%Y/%m/%d %H:%M',
+                '%Y-%m-%d %H:%M:%S', '%Y-%m-%d %H:%M', '%b %d %Y', '%Y/%m/%d', '%Y-%m-%d']
+FACTOR = re.compile(r'^([\d.]+)x')
+TIER_HEADING = re.compile(r'^[ \t]*([A-Za-z][\w -]*?) Tier:?[ \t]*\r?$', re.MULTILINE)
+TRUE_FLAGS = {'enabled', 'enable', 'yes', 'true', 'on'}
+FALSE_FLAGS = {'disabled', 'disable', 'no', 'false', 'off'}
+PARSE_CACHE_SIZE = int(os.environ.get('DD_PARSE_CACHE_SIZE', 0))
+PARSE_CACHE_DIR = os.environ.get('DD_PARSE_CACHE_DIR')
+parse_cache = OrderedDict()
+
+
+class Row(Mapping):
+    # Base of the row classes made by row_class. A row keeps its values in slots and the column names once
+    # on its class, about a third of the memory of a dict per row. It reads and updates like a dict with
+    # fixed keys and attribute access, and as_dict turns it back into a plain dict for JSON.
+    __slots__ = ()
+    _keys = ()
+    _names = {}
+
+    def __init__(self, values=()):
+        list(map(setattr, repeat(self), self.__slots__, chain(values, repeat(None))))
+
+    def __getitem__(self, key):
+        return getattr(self, self._names[key])
+
+    def __setitem__(self, key, value):
+        setattr(self, self._names[key], value)
+
+    def get(self, key, default=None):
+        name = self._names.get(key)
+        return default if name is None else getattr(self, name)
+
+    def __iter__(self):
+        return iter(self._keys)
+
+    def __len__(self):
+        return len(self._keys)
+
+    def __repr__(self):
+        return f'Row({self.as_dict()!r})'
+
+    def as_dict(self):
+        return dict(zip(self._keys, map(getattr, repeat(self), self.__slots__)))
+
+
+@lru_cache(maxsize=256)
+def row_class(keys):
+    # Column names become attribute names: '#clientEntries' is read as row.clientEntries, 'IP address' as
+    # row.IP_address. Names clashing with a keyword, a Row method or another column get a trailing '_'.
+    names = []
+    for key in keys:
+        name = re.sub(r'\W+', '_', key).strip('_') or 'column'
+        if name[0].isdigit():
+            name = f'column_{name}'
+        while keyword.iskeyword(name) or hasattr(Row, name) or name in names:
+            name += '_'
+        names.append(name)
+    return type('Row', (Row,), dict(__slots__=tuple(names), __module__=__name__, _keys=keys,
+                                    _names=dict(zip(keys, names))))
+
+
+def compact_rows(rows):
+    return [row_class(tuple(row))(row.values()) if isinstance(row, dict) else row for row in rows]
+
+
+def plain_rows(rows):
+    return [row.as_dict() if isinstance(row, Row) else row for row in rows]
+
+
+def column_spans(separator):
+    # Each run of dashes in the underline marks one column. A cell runs from the start of its column to the
+    # start of the next one, so values wider than their underline and empty cells both come out right.
+    starts = [m.start() for m in DASH_RUN.finditer(separator)]
+    return [slice(start, end) for start, end in zip(starts, starts[1:] + [None])]
+
+
+def slice_row(line, spans):
+    return [line[span].strip() for span in spans]
+
+
+def table_rows(body, keys, spans, compact=False):
+    lines = body.split('\n')
+    if len(keys) != len(spans):
+        # The declared header does not line up with the underline, keep the old gap based split.
+        rows = []
+        for line in lines:
+            cells = WIDE_GAP.split(line.strip())
+            if len(cells) >= len(keys) - 1:
+                rows.append(row_class(tuple(keys))(cells) if compact else dict(zip(keys, cells)))
+        return rows
+    # Cut column by column and zip the columns back into rows, every step stays inside C loops.
+    strip = str.strip
+    columns = [list(map(strip, map(itemgetter(span), lines))) for span in spans]
+    if compact:
+        rows = list(map(row_class(tuple(keys)), zip(*columns)))
+    else:
+        rows = list(map(dict, map(zip, repeat(keys), zip(*columns))))
+    if len(spans) > 1 and re.search(r'\n {%d}' % spans[1].start, body):
+        # Wrapped lines (blank first column) belong to the row above them.
+        merged = []
+        for row in rows:
+            if row[keys[0]] or not merged:
+                merged.append(row)
+                continue
+            above = merged[-1]
+            for key, cell in row.items():
+                if cell:
+                    above[key] = f'{above[key]} {cell}' if above.get(key) else cell
+        rows = merged
+    return rows
+
+
+def parse_table(output, header=None, compact=False):
+    # Only separator and blank lines are located, by one regex pass over the whole output. Everything between
+    # an opening underline and the next boundary is a table body and is cut into rows in one go. Blank and
+    # separator lines are boundaries themselves, so a body never holds one; a table with no rows has an empty
+    # body and is skipped. Lines may end in \r\n.
+    final_data = []
+    text = '\n' + output
+    body_start = None
+    keys = spans = None
+    for match in BOUNDARY.finditer(text):
+        line = match.group(1)
+        if body_start is not None:
+            if body_start < match.start():
+                final_data.extend(table_rows(text[body_start:match.start()], keys, spans, compact))
+            body_start = None
+            continue
+        if '--' not in line:
+            continue
+        spans = column_spans(line)
+        if header is not None:
+            keys = header
+        else:
+            keys = slice_row(text[text.rfind('\n', 0, match.start()) + 1:match.start()], spans)
+        body_start = match.end() + 1
+    if body_start is not None and body_start < len(text):
+        final_data.extend(table_rows(text[body_start:], keys, spans, compact))
+    return final_data
+
+
+def parse_table_buffer(output, header=None, compact=False):
+    # parse_table over the raw bytes of SSH stdout (bytes, bytearray or mmap). Boundaries are found on the
+    # buffer and only table bodies and their header lines are decoded, through a memoryview, so the whole
+    # output is never decoded, copied with a leading newline or split.
+    final_data = []
+    view = memoryview(output)
+    body_start = None
+    keys = spans = None
+    first = BUFFER_FIRST_LINE.match(output)
+    for match in chain([first] if first else [], BUFFER_BOUNDARY.finditer(output)):
+        line = match.group(1)
+        if body_start is not None:
+            if body_start < match.start():
+                final_data.extend(table_rows(str(view[body_start:match.start()], 'utf-8', 'replace'), keys,
+                                             spans, compact))
+            body_start = None
+            continue
+        if b'--' not in line:
+            continue
+        spans = column_spans(line.decode('ascii'))
+        if header is not None:
+            keys = header
+        else:
+            line_start = output.rfind(b'\n', 0, match.start()) + 1 if match.start() else 0
+            keys = slice_row(str(view[line_start:match.start()], 'utf-8', 'replace'), spans)
+        body_start = match.end() + 1
+    if body_start is not None and body_start < len(output):
+        final_data.extend(table_rows(str(view[body_start:], 'utf-8', 'replace'), keys, spans, compact))
+    return final_data
+
+
+def stream_table(lines, header=None, compact=False):
+    previous = ''
+    keys = spans = make = None
+    pending = None
+    for line in lines:
+        line = line.rstrip('\r\n')
+        if spans is None:
+            if SEPARATOR_LINE.match(line):
+                spans = column_spans(line)
+                keys = header if header is not None else slice_row(previous, spans)
+                make = row_class(tuple(keys)) if compact else None
+            else:
+                previous = line
+            continue
+        if not line.strip() or SEPARATOR_LINE.match(line):
+            # A blank line or a closing underline ends the table.
+            if pending is not None:
+                yield pending
+            previous = line
+            keys = spans = pending = None
+            continue
+        if len(keys) != len(spans):
+            cells = WIDE_GAP.split(line.strip())
+            if len(cells) >= len(keys) - 1:
+                yield make(cells) if compact else dict(zip(keys, cells))
+            continue
+        row = make(slice_row(line, spans)) if compact else dict(zip(keys, slice_row(line, spans)))
+        if pending is not None and not row[keys[0]]:
+            # Wrapped line, it belongs to the row above.
+            for key, cell in row.items():
+                if cell:
+                    pending[key] = f'{pending[key]} {cell}' if pending.get(key) else cell
+            continue
+        if pending is not None:
+            yield pending
+        pending = row
+    if pending is not None:
+        yield pending
+
+
+def iter_rows(lines, header=None, types=None, compact=False):
+    # Streaming counterpart of parse_table: consumes any iterable of lines (a list, a file, a live SSH
+    # channel) and yields each row as soon as it is complete, so callers can filter or stop early.
+    rows = stream_table(lines, header, compact)
+    if not types:
+        return rows
+    return (convert_rows([row], types)[0] for row in rows)
+
+
+# Converters leave values they cannot read untouched. Empty cells and the '-' DDOS prints for n/a become
+# None. They are cached because listings repeat the same few values (flags, states, sizes) over and over.
+@lru_cache(maxsize=4096)
+def to_bytes(value, unit=None):
+    match = SIZE.match(value.strip())
+    if match is None:
+        return value
+    try:
+        number = float(match.group(1).replace(',', ''))
+    except ValueError:
+        # The pattern lets through digit runs that are not numbers, like 1.2.3 or a lone comma.
+        return value
+    return int(number * UNITS[(match.group(2) or unit or 'B').lower()])
+
+
+def to_gib(value):
+    return to_bytes(value, 'GiB')
+
+
+@lru_cache(maxsize=4096)
+def to_int(value):
+    try:
+        return int(value.replace(',', ''))
+    except ValueError:
+        return value
+
+
+@lru_cache(maxsize=4096)
+def to_float(value):
+    try:
+        return float(value.replace(',', ''))
+    except ValueError:
+        return value
+
+
+def to_percent(value):
+    return to_float(value.rstrip('%').strip())
+
+
+@lru_cache(maxsize=4096)
+def to_factor(value):
+    # Compression factors print as 10.0x, optionally followed by the reduction in brackets.
+    match = FACTOR.match(value.strip())
+    return float(match.group(1)) if match else value
+
+
+@lru_cache(maxsize=4096)
+def to_bool(value):
+    flag = value.strip().lower()
+    if flag in TRUE_FLAGS:
+        return True
+    if flag in FALSE_FLAGS:
+        return False
+    return value
+
+
+@lru_cache(maxsize=4096)
+def to_epoch(value):
+    # DDOS prints times without a zone, they are read as UTC.
+    text = ' '.join(value.split())
+    for fmt in TIME_FORMATS:
+        try:
+            return calendar.timegm(time.strptime(text, fmt))
+        except ValueError:
+            continue
+    return value
+
+
+def to_enum(value):
+    # Status like columns repeat a handful of values over thousands of rows. Interned, the rows share one
+    # string object per value instead of a copy each, and comparing them is mostly an identity check.
+    return sys.intern(value)
+
+
+CONVERTERS = dict(size=to_bytes, gib=to_gib, int=to_int, float=to_float, percent=to_percent, factor=to_factor,
+                  bool=to_bool, time=to_epoch, enum=to_enum)
+
+
+def convert_rows(rows, types):
+    # types maps a column to one of the CONVERTERS names. Each typed column is converted in its own pass.
+    for key, kind in types.items():
+        convert = CONVERTERS[kind]
+        for row in rows:
+            value = row.get(key)
+            if isinstance(value, str):
+                row[key] = convert(value) if value and value != '-' else None
+    return rows
+
+
+def parse_tiered(output, header=None, compact=False):
+    # filesys show space and show compression print one table per tier under an "Active Tier:" style
+    # heading. Rows get the tier they belong to, output without headings is read as one table.
+    headings = list(TIER_HEADING.finditer(output))
+    if not headings:
+        return parse_table(output, header, compact)
+    rows = []
+    for heading, following in zip(headings, headings[1:] + [None]):
+        end = following.start() if following is not None else len(output)
+        tier = heading.group(1).strip().lower().replace(' ', '-')
+        for row in parse_table(output[heading.end():end], header):
+            row['tier'] = tier
+            rows.append(row)
+    return compact_rows(rows) if compact else rows
+
+
+def classify(output):
+    # Each marker is looked up once, straight on the output string. Substring search runs at memchr speed,
+    # which measured several times faster than a single regex pass looking for all of them at once.
+    if '--' in output and 'Option' not in output and '- share' not in output:
+        return 'table'
+    if 'Option' in output and 'Value' in output:
+        return 'options'
+    if ': ' in output:
+        return 'key_value'
+    return 'lines'
+
+
+def parse_options(output, header=None):
+    final_data = []
+    for section in output.split('\n\n'):
+        lines = section.strip().split('\n')
+        if ':' in lines[0]:
+            mkey = lines[0].strip().replace(':', '')
+            values = {}
+            for line in lines[1:]:
+                if '--' not in line and 'Option' not in line:
+                    pair = GAP.split(line.strip())
+                    if len(pair) == 2:
+                        values[pair[0]] = pair[1]
+            final_data.append({mkey: values})
+            continue
+        mkeys = GAP.split(lines[0].strip())
+        if 'Option' in mkeys:
+            for line in lines[1:]:
+                if '--' not in line and line:
+                    pair = GAP.split(line.strip())
+                    if len(pair) == 2:
+                        final_data.append({pair[0]: pair[1]})
+        else:
+            for line in lines[1:]:
+                if '--' not in line and 'Option' not in line:
+                    final_data.append(dict(zip(mkeys, GAP.split(line.strip()))))
+    return final_data
+
+
+def parse_key_value(output, header=None):
+    # "Key: value" lines and two column "Key   value" settings. Lines under a key with no value (like
+    # "Servers:") are its items, and any other sentence, like "NTP is disabled.", is kept under message.
+    final_data = []
+    for block in output.replace('\r\n', '\n').split('\n\n'):
+        if not block.strip():
+            continue
+        data = {}
+        last = None
+        for line in block.split('\n'):
+            if ':' in line:
+                key, value = line.split(':', 1)
+                value = value.strip()
+                last = key.strip().lower().replace(' ', '_')
+                data[last] = value if value else []
+            elif line.strip() and '*' not in line and not SEPARATOR_LINE.match(line):
+                pair = GAP.split(line.strip())
+                if len(pair) == 2:
+                    data[pair[0].lower().replace(' ', '_')] = pair[1].strip()
+                elif isinstance(data.get(last), list):
+                    data[last].append(line.strip())
+                else:
+                    data.setdefault('message', []).append(line.strip())
+        final_data.append(data)
+    return final_data
+
+
+def parse_lines(output, header=None):
+    return [dict(output=[line for line in output.split('\n') if line])]
+
+
+PARSERS = dict(table=parse_table, tiered=parse_tiered, options=parse_options, key_value=parse_key_value,
+               lines=parse_lines)
+COMPACT_PARSERS = dict(table=parse_table, tiered=parse_tiered)
+BUFFER_PARSERS = dict(table=parse_table_buffer)
+
+
+def tab_to_json(output, header=None):
+    return parse_output(output, None, header)
+
+
+def memo_key(output, parser, header, types, compact=False):
+    digest = hashlib.sha1(output.encode('utf-8') if isinstance(output, str) else output)
+    digest.update(repr((parser, header, sorted((types or {}).items()), compact)).encode('utf-8'))
+    return digest.hexdigest()
+
+
+def memo_remember(key, rows):
+    parse_cache[key] = rows
+    parse_cache.move_to_end(key)
+    while len(parse_cache) > PARSE_CACHE_SIZE:
+        parse_cache.popitem(last=False)
+
+
+def memo_lookup(key):
+    rows = parse_cache.get(key)
+    if rows is not None:
+        parse_cache.move_to_end(key)
+        return rows
+    if PARSE_CACHE_DIR:
+        try:
+            with open(os.path.join(PARSE_CACHE_DIR, key + '.json')) as f:
+                rows = json.load(f)
+        except (OSError, ValueError):
+            return None
+        memo_remember(key, rows)
+    return rows
+
+
+def memo_store(key, rows):
+    memo_remember(key, rows)
+    if PARSE_CACHE_DIR:
+        # Written to a temp file and renamed, forks parsing the same output may store it at the same time.
+        temp = None
+        try:
+            os.makedirs(PARSE_CACHE_DIR, exist_ok=True)
+            fd, temp = tempfile.mkstemp(dir=PARSE_CACHE_DIR, suffix='.tmp')
+            with os.fdopen(fd, 'w') as f:
+                json.dump(rows, f, default=dict)
+            os.replace(temp, os.path.join(PARSE_CACHE_DIR, key + '.json'))
+        except (OSError, TypeError, ValueError):
+            if temp is not None and os.path.exists(temp):
+                os.remove(temp)
+
+
+def parse_output(output, parser=None, header=None, types=None, compact=False):
+    # Actions in cmd_templates name their parser, so their output goes straight to it. Actions that do
+    # not declare one still go through classify. Declared column types are applied to the rows.
+    # Results can be memoized on a hash of the output and the parse settings, in memory (DD_PARSE_CACHE_SIZE)
+    # and on disk (DD_PARSE_CACHE_DIR), so unchanged outputs are not parsed again. Both are off by default, a
+    # module process parses an output once. Memoized rows are shared, treat them as read-only.
+    # With compact, table and tiered output comes back as Row objects rather than dicts. Output can also be
+    # the undecoded bytes of SSH stdout, parsed as they are by the table parser and decoded for the others.
+    if not isinstance(output, str) and parser not in BUFFER_PARSERS:
+        output = str(output, 'utf-8', 'replace')
+    key = None
+    name = parser or classify(output)
+    compact = compact and name in COMPACT_PARSERS
+    if PARSE_CACHE_SIZE or PARSE_CACHE_DIR:
+        key = memo_key(output, parser, header, types, compact)
+        rows = memo_lookup(key)
+        if rows is not None:
+            if compact and rows and isinstance(rows[0], dict):
+                # Read back from the disk cache as plain dicts.
+                rows = compact_rows(rows)
+                memo_remember(key, rows)
+            return rows
+    if not isinstance(output, str):
+        rows = BUFFER_PARSERS[name](output, header, compact)
+    elif compact:
+        rows = COMPACT_PARSERS[name](output, header, compact)
+    else:
+        rows = PARSERS[name](output, header)
+    if types:
+        convert_rows(rows, types)
+    if key is not None:
+        memo_store(key, rows)
+    return rows
+
+
+def records(data):
+    # Rows from structured output, or rebuilt from columnar output.
+    if isinstance(data, dict):
+        keys = list(data)
+        return [dict(zip(keys, values)) for values in zip(*data.values())]
+    return data
+
+
+def diff_rows(before, after, key):
+    # Rows are matched on their natural key (a column, or a list of columns), so the whole diff is two
+    # dict builds and one pass. When a key repeats within one side, the last row wins.
+    columns = [key] if isinstance(key, str) else list(key)
+    pick = itemgetter(*columns)
+
+    def index(rows):
+        return dict((pick(row), row) for row in records(rows) if all(column in row for column in columns))
+
+    old = index(before)
+    new = index(after)
+    changed = []
+    for name, row in new.items():
+        previous = old.get(name)
+        if previous is not None and previous != row:
+            changes = [column for column in row.keys() | previous.keys() if row.get(column) != previous.get(column)]
+            changed.append(dict(key=name, columns=sorted(changes), before=previous, after=row))
+    return dict(added=[row for name, row in new.items() if name not in old],
+                removed=[row for name, row in old.items() if name not in new],
+                changed=changed)
+
+
+def flatten_record(record, prefix=''):
+    flat = {}
+    for key, value in record.items():
+        if isinstance(value, dict):
+            flat.update(flatten_record(value, f'{prefix}{key}.'))
+        else:
+            flat[f'{prefix}{key}'] = value
+    return flat
+
+
+def record_rows(records, header, columns=None, types=None):
+    # REST records laid out as the rows of the matching SSH table. Each header column is read from the
+    # (dotted) field columns maps it to, or else from the field of the same name, and typed like the table.
+    columns = columns or {}
+    rows = []
+    for record in records:
+        flat = flatten_record(record)
+        rows.append(dict((name, flat.get(columns.get(name, name))) for name in header))
+    if types:
+        convert_rows(rows, types)
+    return rows
+
+
+def columnar_records(records):
+    # Packs a stream of records into one list per (dotted) field. Fields missing from a record are padded
+    # with None so every column keeps the same length.
+    if isinstance(records, list) and records and isinstance(records[0], Row):
+        kind = type(records[0])
+        if all(type(record) is kind for record in records):
+            # Rows of one table share their slots, each column is read out in a single pass.
+            return dict((key, list(map(attrgetter(kind._names[key]), records))) for key in kind._keys)
+    columns = {}
+    count = 0
+    for record in records:
+        flat = flatten_record(record)
+        for key in flat:
+            if key not in columns:
+                columns[key] = [None] * count
+        for key, column in columns.items():
+            column.append(flat.get(key))
+        count += 1
+    return columns
@@ -19,7 +19,7 @@ from ..module_utils import dd_connect
 import ansible.module_utils.common.json
 import ansible.module_utils.compat.importlib
 import json
-from ..module_utils.cmd_templates import adminaccess
+from ..module_utils.catalogues.adminaccess import adminaccess
 
 DOCUMENTATION = r'''
 ---
@@ -40,6 +40,18 @@ options:
     choices:
     - http, https, ftp, ftps, telnet, ssh, scp, web-service, all
     description: 'This attribute specifies the services you want to toggle'
+  output_format:
+    type: str
+    description: 'Shape of show output. raw returns the command text unparsed, structured one dict per row,
+      columnar one list per column and both the raw text next to the structured rows'
+    choices: [raw, structured, columnar, both]
+    default: structured
+  items:
+    type: list
+    elements: dict
+    description: 'Batch mode. One command is run per item, from the module options with the item''s own
+      options (for example service) laid over them. SSH commands share one connection. msg is then the
+      list of per item results with item, action, failed, changed and output'
 author:
     - Sudarshan Kshirsagar (@kshirs1)
 '''
@@ -61,12 +73,15 @@ def main():
     fields = {
         'state': {'type': 'str', 'choices': ['enable', 'disable', 'show'], 'required': True},
         'service': {'type': 'str', 'choices': ['http', 'https', 'ftp', 'ftps', 'telnet', 'ssh', 'scp', 'web-service', 'all']},
+        'output_format': {'type': 'str', 'choices': ['raw', 'structured', 'columnar', 'both'],
+                          'default': 'structured'},
         'host': {'type': 'str', 'required': True},
         'port': {'type': 'int', 'default': 22},
         'username': {'type': 'str', 'required': True},
         'private_key': {'type': 'str', 'no_log': True},
         'password': {'type': 'str', 'no_log': True},
     }
+    fields['items'] = cmd_builder.item_argument(fields)
     module = AnsibleModule(argument_spec=fields, mutually_exclusive=[('private_key', 'password')],
                            required_one_of=[('private_key', 'password')])
 
@@ -80,11 +95,17 @@ def main():
     for key, value in module.params.items():
         if value is not None:
             arg_dict[key] = value
-    keys_to_delete = ['host', 'username', 'private_key', 'password']
+    keys_to_delete = ['host', 'username', 'private_key', 'password', 'output_format', 'items']
     for key in keys_to_delete:
         if key in arg_dict:
             del arg_dict[key]
 
+    if module.params['items']:
+        results, changed, failed = cmd_builder.run_items(module, arg_dict, module.params['items'], conditions,
+                                                         supported_commands, server, user, port, private_key,
+                                                         password, module.params['output_format'])
+        module.exit_json(failed=failed, msg=results, changed=changed)
+
     cmd_output = {}
     changed = False
     action = cmd_builder.condition_check(conditions=conditions, command_build_dict=arg_dict)
@@ -94,9 +115,11 @@ def main():
                                                                     conditions=conditions)
         changed = will_change
         cmd_output = cmd_builder.run_cmd(module=module, command=command, is_filter=is_filter, server=server,
+                                         action=action, conditions=conditions,
                                          user=user, port=port, private_key=private_key, password=password, header=header)
-        if 'show' in str(command):
-            jsonout = dd_connect.tab_to_json(cmd_output['output'], header)
+        if cmd_builder.parses_output(action, conditions) and not cmd_output['failed']:
+            jsonout = cmd_builder.parse_output(action, conditions, cmd_output['output'],
+                                               module.params['output_format'])
             cmd_output['output'] = jsonout
     else:
         state = arg_dict['state']
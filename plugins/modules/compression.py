@@ -19,7 +19,7 @@ from ..module_utils import cmd_builder
 import ansible.module_utils.common.json
 import ansible.module_utils.compat.importlib
 import json
-from ..module_utils.cmd_templates import compression
+from ..module_utils.catalogues.compression import compression
 
 DOCUMENTATION = r'''
 module: compression
@@ -109,6 +109,18 @@ options:
   throttle:
     type: str
     description: 'Specify how much CPU to use for measurement task. Use number between 1 - 100 '
+  output_format:
+    type: str
+    description: 'Shape of show output. raw returns the command text unparsed, structured one dict per row,
+      columnar one list per column and both the raw text next to the structured rows'
+    choices: [raw, structured, columnar, both]
+    default: structured
+  items:
+    type: list
+    elements: dict
+    description: 'Batch mode. One command is run per item, from the module options with the item''s own
+      options (for example mtrees) laid over them. SSH commands share one connection. msg is then the
+      list of per item results with item, action, failed, changed and output'
 auther:
   - Sudarshan Kshirsagar (@kshirs1)
 '''
@@ -218,6 +230,11 @@ EXAMPLES = r'''
 '''
 
 
+def fix_command(action, command):
+    # The schedule sub-option names are rendered with their values, "name" is not part of the CLI.
+    return [command[0].replace("name", "")]
+
+
 def main():
     conditions, supported_commands = compression()
     fields = {
@@ -240,6 +257,8 @@ def main():
                                                 'monthly': {'type': 'str'},
                                                 }},
         'throttle': {'type': 'str'},
+        'output_format': {'type': 'str', 'choices': ['raw', 'structured', 'columnar', 'both'],
+                          'default': 'structured'},
         'host': {'type': 'str', 'required': True},
         'port': {'type': 'int', 'default': 22},
         'username': {'type': 'str', 'required': True},
@@ -247,6 +266,7 @@ def main():
         'password': {'type': 'str', 'no_log': True},
     }
 
+    fields['items'] = cmd_builder.item_argument(fields)
     module = AnsibleModule(argument_spec=fields, mutually_exclusive=[('private_key', 'password')],
                            required_one_of=[('private_key', 'password')])
 
@@ -260,11 +280,18 @@ def main():
     for key, value in module.params.items():
         if value is not None:
             arg_dict[key] = value
-    keys_to_delete = ['host', 'username', 'private_key', 'password']
+    keys_to_delete = ['host', 'username', 'private_key', 'password', 'output_format', 'items']
     for key in keys_to_delete:
         if key in arg_dict:
             del arg_dict[key]
 
+    if module.params['items']:
+        results, changed, failed = cmd_builder.run_items(module, arg_dict, module.params['items'], conditions,
+                                                         supported_commands, server, user, port, private_key,
+                                                         password, module.params['output_format'],
+                                                         command_hook=fix_command)
+        module.exit_json(failed=failed, msg=results, changed=changed)
+
     cmd_output = {}
     changed = False
     action = cmd_builder.condition_check(conditions=conditions, command_build_dict=arg_dict)
@@ -272,13 +299,15 @@ def main():
         command, will_change, is_filter, header = cmd_builder.build_command(action=action, arg_dict=arg_dict,
                                                                     supported_commands=supported_commands,
                                                                     conditions=conditions)
-        command = [command[0].replace("name", "")]
+        command = fix_command(action, command)
         changed = will_change
         cmd_output = cmd_builder.run_cmd(module=module, command=command, is_filter=is_filter, server=server,
+                                         action=action, conditions=conditions,
 
                                          user=user, port=port, private_key=private_key, password=password)
-        if 'schedule show' in str(command):
-            jsonout = dd_connect.tab_to_json(cmd_output['output'], header)
+        if cmd_builder.parses_output(action, conditions) and not cmd_output['failed']:
+            jsonout = cmd_builder.parse_output(action, conditions, cmd_output['output'],
+                                               module.params['output_format'])
             cmd_output['output'] = jsonout
                                          
         # if 'schedule show' in str(command):
@@ -17,7 +17,7 @@ from ..module_utils import cmd_builder
 import ansible.module_utils.common.json
 import ansible.module_utils.compat.importlib
 import json
-from ..module_utils.cmd_templates import config
+from ..module_utils.catalogues.config import config
 
 
 DOCUMENTATION = r'''
@@ -69,6 +69,12 @@ options:
         description: Timezone names begin with Africa, America, Antarctica, Asia, Atlantic, Australia, Brazil, Canada, Chile, Europe, Indian, Mexico, Mideast, Pacific and US
         type: str
         required: false
+    items:
+        description: Batch mode. One command is run per item, from the module options with the
+            item's own options (for example option and its value) laid over them. SSH commands share one connection.
+            msg is then the list of per item results with item, action, failed, changed and output
+        type: list
+        elements: dict
 author:
     - Sudarshan Kshirsagar (@kshirs1)
 '''
@@ -179,6 +185,7 @@ def main():
     }
 
 
+    fields['items'] = cmd_builder.item_argument(fields)
     module = AnsibleModule(argument_spec=fields, mutually_exclusive=[('private_key', 'password')],
                            required_one_of=[('private_key', 'password')])
 
@@ -199,11 +206,17 @@ def main():
     port = module.params['port']
     private_key = module.params['private_key']
     password = module.params['password']
-    keys_to_delete = ['host', 'username', 'private_key', 'password']
+    keys_to_delete = ['host', 'username', 'private_key', 'password', 'items']
     for key in keys_to_delete:
         if key in arg_dict:
             del arg_dict[key]
 
+    if module.params['items']:
+        results, changed, failed = cmd_builder.run_items(module, arg_dict, module.params['items'], conditions,
+                                                         supported_commands, server, user, port, private_key,
+                                                         password, 'raw')
+        module.exit_json(failed=failed, msg=results, changed=changed)
+
     cmd_output = {}
     changed = False
     action = cmd_builder.condition_check(conditions=conditions, command_build_dict=arg_dict)
@@ -213,6 +226,7 @@ def main():
                                                                     conditions=conditions)
         changed = will_change
         cmd_output = cmd_builder.run_cmd(module=module, command=command, is_filter=is_filter, server=server,
+                                         action=action, conditions=conditions,
                                          user=user, port=port, private_key=private_key, password=password, header=header)
     else:
         state = arg_dict['state']
@@ -17,7 +17,7 @@ from ..module_utils import cmd_builder
 import ansible.module_utils.common.json
 import ansible.module_utils.compat.importlib
 import json
-from ..module_utils.cmd_templates import ddboost
+from ..module_utils.catalogues.ddboost import ddboost
 
 DOCUMENTATION = r'''
 ---
@@ -81,6 +81,18 @@ options:
             combined-stream-hard-limit:
                 description: specify soft limit for number of streams for all read write and replication
                 type: str
+    output_format:
+        description: Shape of status and show output. raw returns the command text unparsed, structured one dict
+            per row, columnar one list per column and both the raw text next to the structured rows
+        type: str
+        choices: [raw, structured, columnar, both]
+        default: raw
+    items:
+        description: Batch mode. One command is run per item, from the module options with the
+            item's own options (for example storage-unit) laid over them. SSH commands share one connection.
+            msg is then the list of per item results with item, action, failed, changed and output
+        type: list
+        elements: dict
 author:
     - Sudarshan Kshirsagar (@kshirs1)
 '''
@@ -174,6 +186,8 @@ def main():
                                                       'repl-stream-soft-limit': {'type': 'str'},
                                                       'combined-stream-soft-limit': {'type': 'str'},
                                                       'combined-stream-hard-limit': {'type': 'str'}}},
+        'output_format': {'type': 'str', 'choices': ['raw', 'structured', 'columnar', 'both'],
+                          'default': 'raw'},
         'host': {'type': 'str', 'required': True},
         'port': {'type': 'int', 'default': 22},
         'username': {'type': 'str', 'required': True},
@@ -181,6 +195,7 @@ def main():
         'password': {'type': 'str', 'no_log': True},
     }
 
+    fields['items'] = cmd_builder.item_argument(fields)
     module = AnsibleModule(argument_spec=fields, mutually_exclusive=[('private_key', 'password')],
                            required_one_of=[('private_key', 'password')])
 
@@ -194,11 +209,17 @@ def main():
     port = module.params['port']
     private_key = module.params['private_key']
     password = module.params['password']
-    keys_to_delete = ['host', 'username', 'private_key', 'password']
+    keys_to_delete = ['host', 'username', 'private_key', 'password', 'output_format', 'items']
     for key in keys_to_delete:
         if key in arg_dict:
             del arg_dict[key]
 
+    if module.params['items']:
+        results, changed, failed = cmd_builder.run_items(module, arg_dict, module.params['items'], conditions,
+                                                         supported_commands, server, user, port, private_key,
+                                                         password, module.params['output_format'])
+        module.exit_json(failed=failed, msg=results, changed=changed)
+
     cmd_output = {}
     changed = False
     action = cmd_builder.condition_check(conditions=conditions, command_build_dict=arg_dict)
@@ -206,7 +227,11 @@ def main():
         command, will_change, is_filter, header = cmd_builder.build_command(action=action, arg_dict=arg_dict, supported_commands=supported_commands, conditions=conditions)
         changed = will_change
         cmd_output = cmd_builder.run_cmd(module=module, command=command, is_filter=is_filter, server=server,
+                                         action=action, conditions=conditions,
                                          user=user, port=port, private_key=private_key, password=password, header=header)
+        if cmd_builder.parses_output(action, conditions) and not cmd_output['failed']:
+            cmd_output['output'] = cmd_builder.parse_output(action, conditions, cmd_output['output'],
+                                                            module.params['output_format'])
     else:
         state = arg_dict['state']
         possible_options = {}
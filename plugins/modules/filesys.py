@@ -17,7 +17,7 @@ from ..module_utils import cmd_builder
 import ansible.module_utils.common.json
 import ansible.module_utils.compat.importlib
 import json
-from ..module_utils.cmd_templates import filesys
+from ..module_utils.catalogues.filesys import filesys
 
 
 DOCUMENTATION = r'''
@@ -50,16 +50,18 @@ description: This module supported below actions on filesys
     filesys encryption keys sync
     filesys fastcopy source $filecopy_source destination $filecopy_destination
     filesys status
+    filesys show space
+    filesys show compression
 options:
     state:
         description: Use the one of the action to perform. 
         type: str
-        choices: [enable, disable, status, set, reset, status, abort, apply, modify, abort-apply-changes, apply-changes, start, stop, create, delete, destroy, sync]
+        choices: [enable, disable, status, set, reset, status, abort, apply, modify, abort-apply-changes, apply-changes, start, stop, create, delete, destroy, sync, show]
         required: True
     option:
         description: Specify which attribute of filesys you want to work on
         type: str
-        choices: [encryption, clean, fastcopy]
+        choices: [encryption, clean, fastcopy, space, compression]
     encryption:
         description: use one of the Encryption type 
         type: str
@@ -127,6 +129,18 @@ options:
             all:
                 description: Use only when state is reset. This will reset both Schedule and Throttle to default values
                 type: str
+    output_format:
+        description: Shape of show output. raw returns the command text unparsed, structured one dict per row,
+            columnar one list per column and both the raw text next to the structured rows
+        type: str
+        choices: [raw, structured, columnar, both]
+        default: structured
+    items:
+        description: Batch mode. One command is run per item, from the module options with the
+            item's own options (for example operation) laid over them. SSH commands share one connection.
+            msg is then the list of per item results with item, action, failed, changed and output
+        type: list
+        elements: dict
 author:
     - Sudarshan Kshirsagar (@kshirs1)
 '''
@@ -307,6 +321,16 @@ EXAMPLES = r'''
             key-class: classic
             kmip-user: sudarshan
 
+  - name: Space usage per tier, sizes in bytes
+    dellemc.datadomain.filesys:
+        state: show
+        operation: space
+
+  - name: Compression factors per tier
+    dellemc.datadomain.filesys:
+        state: show
+        operation: compression
+
 '''
 
 
@@ -315,9 +339,9 @@ def main():
     fields = {
         'state': {'type': 'str', 'choices': ['enable', 'disable', 'status', 'set', 'reset', 'status', 'abort', 'apply',
                                              'modify', 'abort-apply-changes', 'apply-changes', 'start', 'stop',
-                                             'create', 'delete', 'destroy', 'sync'],
+                                             'create', 'delete', 'destroy', 'sync', 'show'],
                   'required': True},
-        'operation': {'type': 'str', 'choices': ['encryption', 'clean', 'fastcopy']},
+        'operation': {'type': 'str', 'choices': ['encryption', 'clean', 'fastcopy', 'space', 'compression']},
         'encryption': {'type': 'str', 'choices': ['algorithm', 'embedded-key-manager', 'key-manager']},
         'algorithm': {'type': 'str', 'choices':['aes_128_cbc', 'aes_256_cbc', 'aes_128_gcm', 'aes_256_gcm']},
         'key-rotation-policy': {'type': 'str'},
@@ -337,6 +361,8 @@ def main():
         'fastcopy-destination': {'type': 'str'},
         'clean': {'type': 'dict', 'options': {
             'schedule': {'type': 'str'}, 'throttle': {'type': 'str'}, 'all': {'type': 'str'}}},
+        'output_format': {'type': 'str', 'choices': ['raw', 'structured', 'columnar', 'both'],
+                          'default': 'structured'},
         'host': {'type': 'str', 'required': True},
         'port': {'type': 'int', 'default': 22},
         'username': {'type': 'str', 'required': True},
@@ -345,6 +371,7 @@ def main():
     }
 
 
+    fields['items'] = cmd_builder.item_argument(fields)
     module = AnsibleModule(argument_spec=fields, mutually_exclusive=[('private_key', 'password')],
                            required_one_of=[('private_key', 'password')])
 
@@ -366,11 +393,17 @@ def main():
     port = module.params['port']
     private_key = module.params['private_key']
     password = module.params['password']
-    keys_to_delete = ['host', 'username', 'private_key', 'password']
+    keys_to_delete = ['host', 'username', 'private_key', 'password', 'output_format', 'items']
     for key in keys_to_delete:
         if key in arg_dict:
             del arg_dict[key]
 
+    if module.params['items']:
+        results, changed, failed = cmd_builder.run_items(module, arg_dict, module.params['items'], conditions,
+                                                         supported_commands, server, user, port, private_key,
+                                                         password, module.params['output_format'])
+        module.exit_json(failed=failed, msg=results, changed=changed)
+
     cmd_output = {}
     changed = False
     action = cmd_builder.condition_check(conditions=conditions, command_build_dict=arg_dict)
@@ -380,7 +413,12 @@ def main():
                                                                     conditions=conditions)
         changed = will_change
         cmd_output = cmd_builder.run_cmd(module=module, command=command, is_filter=is_filter, server=server,
+                                         action=action, conditions=conditions,
                                          user=user, port=port, private_key=private_key, password=password, header=header)
+        if cmd_builder.parses_output(action, conditions) and not cmd_output['failed']:
+            jsonout = cmd_builder.parse_output(action, conditions, cmd_output['output'],
+                                               module.params['output_format'])
+            cmd_output['output'] = jsonout
     else:
         state = arg_dict['state']
         possible_options = {}
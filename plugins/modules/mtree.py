@@ -2,7 +2,6 @@
 from __future__ import (absolute_import, division,
                         print_function)
 from ansible.module_utils.basic import AnsibleModule
-from ..module_utils.dd_connect import tab_to_json
 
 __metaclass__ = type
 
@@ -21,7 +20,7 @@ from ..module_utils import cmd_builder
 import ansible.module_utils.common.json
 import ansible.module_utils.compat.importlib
 import json
-from ..module_utils.cmd_templates import mtree
+from ..module_utils.catalogues.mtree import mtree
 
 DOCUMENTATION = '''
 ---
@@ -110,6 +109,18 @@ options:
                 description: automatic retention lock delay format 120Minutes
                 type: str
 
+    output_format:
+        description: Shape of show output. raw returns the command text unparsed, structured one dict per row,
+            columnar one list per column and both the raw text next to the structured rows
+        type: str
+        choices: [raw, structured, columnar, both]
+        default: structured
+    items:
+        description: Batch mode. One command is run per item, from the module options with the
+            item's own options (for example mtree-path) laid over them. SSH commands share one connection.
+            msg is then the list of per item results with item, action, failed, changed and output
+        type: list
+        elements: dict
 author:
     - Sudarshan Kshirsagar (@kshirs1)
 '''
@@ -127,6 +138,16 @@ EXAMPLES = r'''
             quota-soft-limit: 10 GiB
             quota-hard-limit: 12 GiB
 
+  - name: Create several MTrees over one connection
+    dellemc.datadomain.mtree:
+        state: create
+        items:
+            - mtree-path: /data/col1/a001us043nve002
+            - mtree-path: /data/col1/a001us043nve003
+              quota:
+                  quota-soft-limit: 10 GiB
+                  quota-hard-limit: 12 GiB
+
   - name: Delete a MTree
     dellemc.datadomain.mtree:
         state: delete
@@ -197,6 +218,8 @@ def main():
                                                   'max-retention-period': {'type': 'str'},
                                                   'automatic-retention-period': {'type': 'str'},
                                                   'automatic-lock-delay': {'type': 'str'}}},
+        'output_format': {'type': 'str', 'choices': ['raw', 'structured', 'columnar', 'both'],
+                          'default': 'structured'},
         'host': {'type': 'str', 'required': True},
         'port': {'type': 'int', 'default': 22},
         'username': {'type': 'str', 'required': True},
@@ -204,6 +227,7 @@ def main():
         'password': {'type': 'str', 'no_log': True},
     }
 
+    fields['items'] = cmd_builder.item_argument(fields)
     module = AnsibleModule(
         argument_spec=fields, mutually_exclusive=[('private_key', 'password')],
                            required_one_of=[('private_key', 'password')]
@@ -226,11 +250,17 @@ def main():
     port = module.params['port']
     private_key = module.params['private_key']
     password = module.params['password']
-    keys_to_delete = ['host', 'username', 'private_key', 'password']
+    keys_to_delete = ['host', 'username', 'private_key', 'password', 'output_format', 'items']
     for key in keys_to_delete:
         if key in arg_dict:
             del arg_dict[key]
 
+    if module.params['items']:
+        results, changed, failed = cmd_builder.run_items(module, arg_dict, module.params['items'], conditions,
+                                                         supported_commands, server, user, port, private_key,
+                                                         password, module.params['output_format'])
+        module.exit_json(failed=failed, msg=results, changed=changed)
+
     cmd_output = {}
     changed = False
     action = cmd_builder.condition_check(conditions=conditions, command_build_dict=arg_dict)
@@ -240,9 +270,11 @@ def main():
                                                                     conditions=conditions)
         changed = will_change
         cmd_output = cmd_builder.run_cmd(module=module, command=command, is_filter=is_filter, server=server,
+                                         action=action, conditions=conditions,
                                          user=user, port=port, private_key=private_key, password=password)
-        if 'mtree list' in str(command):
-            jsonout = tab_to_json(cmd_output['output'], header)
+        if cmd_builder.parses_output(action, conditions) and not cmd_output['failed']:
+            jsonout = cmd_builder.parse_output(action, conditions, cmd_output['output'],
+                                               module.params['output_format'])
             cmd_output['output'] = jsonout
 
     else:
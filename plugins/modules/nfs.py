@@ -16,8 +16,7 @@ from ..module_utils import cmd_builder
 import ansible.module_utils.common.json
 import ansible.module_utils.compat.importlib
 import json
-from ..module_utils.cmd_templates import nfs
-from ..module_utils.dd_connect import tab_to_json
+from ..module_utils.catalogues.nfs import nfs
 
 
 DOCUMENTATION = r'''
@@ -62,6 +61,18 @@ options:
     options:
         description: export options like 'rw,no_root_squash,no_all_squash,secure'
         type: str
+    output_format:
+        description: Shape of show output. raw returns the command text unparsed, structured one dict per row,
+            columnar one list per column and both the raw text next to the structured rows
+        type: str
+        choices: [raw, structured, columnar, both]
+        default: structured
+    items:
+        description: Batch mode. One command is run per item, from the module options with the
+            item's own options (for example export-name and clients) laid over them. SSH commands share one connection.
+            msg is then the list of per item results with item, action, failed, changed and output
+        type: list
+        elements: dict
 author:
     - Sudarshan Kshirsagar (@kshirs1)
 '''
@@ -81,6 +92,15 @@ EXAMPLES = r'''
         state: add
         export-name: backupserver01
         client-list: 10.0.0.6 10.0.0.7
+
+  - name: Add clients to several exports over one connection
+    dellemc.datadomain.nfs:
+        state: add
+        items:
+            - export-name: backupserver01
+              clients: 10.0.0.6
+            - export-name: backupserver02
+              clients: 10.0.0.7 10.0.0.8
  
   - name: Create an export, optionally add clients
     dellemc.datadomain.nfs:
@@ -152,6 +172,8 @@ def main():
         'export-name': {'type': 'str'},
         'new-export-name': {'type': 'str'},
         'options': {'type': 'str'},
+        'output_format': {'type': 'str', 'choices': ['raw', 'structured', 'columnar', 'both'],
+                          'default': 'structured'},
         'host': {'type': 'str', 'required': True},
         'port': {'type': 'int', 'default': 22},
         'username': {'type': 'str', 'required': True},
@@ -160,6 +182,7 @@ def main():
     }
 
 
+    fields['items'] = cmd_builder.item_argument(fields)
     module = AnsibleModule(argument_spec=fields, mutually_exclusive=[('private_key', 'password')],
                            required_one_of=[('private_key', 'password')])
 
@@ -180,21 +203,29 @@ def main():
     port = module.params['port']
     private_key = module.params['private_key']
     password = module.params['password']
-    keys_to_delete = ['host', 'username', 'private_key', 'password']
+    keys_to_delete = ['host', 'username', 'private_key', 'password', 'output_format', 'items']
     for key in keys_to_delete:
         if key in arg_dict:
             del arg_dict[key]
 
+    if module.params['items']:
+        results, changed, failed = cmd_builder.run_items(module, arg_dict, module.params['items'], conditions,
+                                                         supported_commands, server, user, port, private_key,
+                                                         password, module.params['output_format'])
+        module.exit_json(failed=failed, msg=results, changed=changed)
+
     cmd_output = {}
     changed = False
     action = cmd_builder.condition_check(conditions=conditions, command_build_dict=arg_dict)
     if len(action) > 0:
         command, will_change, is_filter, header = cmd_builder.build_command(action=action, arg_dict=arg_dict, supported_commands=supported_commands, conditions=conditions)
         cmd_output = cmd_builder.run_cmd(module=module, command=command, is_filter=is_filter, server=server,
+                                         action=action, conditions=conditions,
                                          user=user, port=port, private_key=private_key, password=password, header=header)
         changed = will_change
-        if 'show' in str(command):
-            jsonout = tab_to_json(cmd_output['output'], header)
+        if cmd_builder.parses_output(action, conditions) and not cmd_output['failed']:
+            jsonout = cmd_builder.parse_output(action, conditions, cmd_output['output'],
+                                               module.params['output_format'])
             cmd_output['output'] = jsonout
     else:
         state = arg_dict['state']
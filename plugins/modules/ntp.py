@@ -16,7 +16,7 @@ from ..module_utils import cmd_builder
 import ansible.module_utils.common.json
 import ansible.module_utils.compat.importlib
 import json
-from ..module_utils.cmd_templates import ntp
+from ..module_utils.catalogues.ntp import ntp
 
 
 DOCUMENTATION = r'''
@@ -43,6 +43,18 @@ options:
         description: Time server IP or hostname
         type: str
 
+    output_format:
+        description: Shape of status and show output. raw returns the command text unparsed, structured one dict
+            per row, columnar one list per column and both the raw text next to the structured rows
+        type: str
+        choices: [raw, structured, columnar, both]
+        default: raw
+    items:
+        description: Batch mode. One command is run per item, from the module options with the
+            item's own options (for example timeserver) laid over them. SSH commands share one connection.
+            msg is then the list of per item results with item, action, failed, changed and output
+        type: list
+        elements: dict
 author:
     - Sudarshan Kshirsagar (@kshirs1)
 '''
@@ -90,6 +102,8 @@ def main():
     fields = {
         'state': {'type': 'str', 'choices': ['add', 'del', 'enable', 'disable', 'reset', 'sync', 'status', 'show'], 'required': True},
         'timeserver': {'type': 'str'},
+        'output_format': {'type': 'str', 'choices': ['raw', 'structured', 'columnar', 'both'],
+                          'default': 'raw'},
         'host': {'type': 'str', 'required': True},
         'port': {'type': 'int', 'default': 22},
         'username': {'type': 'str', 'required': True},
@@ -98,6 +112,7 @@ def main():
     }
 
 
+    fields['items'] = cmd_builder.item_argument(fields)
     module = AnsibleModule(argument_spec=fields, mutually_exclusive=[('private_key', 'password')],
                            required_one_of=[('private_key', 'password')])
 
@@ -119,18 +134,28 @@ def main():
     port = module.params['port']
     private_key = module.params['private_key']
     password = module.params['password']
-    keys_to_delete = ['host', 'username', 'private_key', 'password']
+    keys_to_delete = ['host', 'username', 'private_key', 'password', 'output_format', 'items']
     for key in keys_to_delete:
         if key in arg_dict:
             del arg_dict[key]
 
+    if module.params['items']:
+        results, changed, failed = cmd_builder.run_items(module, arg_dict, module.params['items'], conditions,
+                                                         supported_commands, server, user, port, private_key,
+                                                         password, module.params['output_format'])
+        module.exit_json(failed=failed, msg=results, changed=changed)
+
     cmd_output = {}
     changed = False
     action = cmd_builder.condition_check(conditions=conditions, command_build_dict=arg_dict)
     if len(action) > 0:
         command, will_change, is_filter, header = cmd_builder.build_command(action=action, arg_dict=arg_dict, supported_commands=supported_commands, conditions=conditions)
         cmd_output = cmd_builder.run_cmd(module=module, command=command, is_filter=is_filter, server=server,
+                                         action=action, conditions=conditions,
                                          user=user, port=port, private_key=private_key, password=password, header=header)
+        if cmd_builder.parses_output(action, conditions) and not cmd_output['failed']:
+            cmd_output['output'] = cmd_builder.parse_output(action, conditions, cmd_output['output'],
+                                                            module.params['output_format'])
         changed = will_change
     else:
         state = arg_dict['state']
@@ -0,0 +1,113 @@
+# Copyright ©️ 2022 Dell Inc. or its subsidiaries.
+from __future__ import (absolute_import, division,
+                        print_function)
+from ansible.module_utils.basic import AnsibleModule
+__metaclass__ = type
+
+from ..module_utils import dd_connect
+from ..module_utils import cmd_builder
+from ..module_utils.catalogues.stats import stats
+
+
+DOCUMENTATION = r'''
+---
+module: stats
+short_description: This module is used to pull historical capacity and performance statistics
+version_added: "1.0.0"
+description: This module pulls the historical statistics the Data Domain REST API keeps, for a time range,
+    in one call per appliance. Every page of the series is fetched over one REST session and the result
+    is returned as columns, one list per metric, rather than one dictionary per sample.
+options:
+    state:
+        description: Statistics you want to pull
+        type: str
+        choices: [capacity, performance]
+        required: True
+    start:
+        description: Start of the time range, in epoch seconds. All available history when not set.
+        type: int
+    end:
+        description: End of the time range, in epoch seconds. Up to the latest sample when not set.
+        type: int
+    interval:
+        description: Aggregation interval of the samples
+        type: str
+        choices: [hour, day, week, month]
+    data-view:
+        description: Data view requested from the appliance e.g. tier
+        type: str
+    page-size:
+        description: Number of samples fetched per REST request
+        type: int
+        default: 500
+    dd-password:
+        description: Password of the Data Domain user used for the REST API. The SSH password is used when not set.
+        type: str
+
+author:
+    - Sudarshan Kshirsagar (@kshirs1)
+'''
+
+EXAMPLES = r'''
+  - name: Daily capacity since 1 October 2022
+    dellemc.datadomain.stats:
+        state: capacity
+        start: 1664582400
+        interval: day
+
+  - name: Hourly performance between two points in time
+    dellemc.datadomain.stats:
+        state: performance
+        start: 1664582400
+        end: 1664668800
+        interval: hour
+'''
+
+
+def main():
+    conditions, supported_commands = stats()
+    fields = {
+        'state': {'type': 'str', 'choices': ['capacity', 'performance'], 'required': True},
+        'start': {'type': 'int'},
+        'end': {'type': 'int'},
+        'interval': {'type': 'str', 'choices': ['hour', 'day', 'week', 'month']},
+        'data-view': {'type': 'str'},
+        'page-size': {'type': 'int', 'default': 500},
+        'dd-password': {'type': 'str', 'no_log': True},
+        'host': {'type': 'str', 'required': True},
+        'username': {'type': 'str', 'required': True},
+        'private_key': {'type': 'str', 'no_log': True},
+        'password': {'type': 'str', 'no_log': True},
+    }
+
+    module = AnsibleModule(argument_spec=fields, mutually_exclusive=[('private_key', 'password')],
+                           required_one_of=[('dd-password', 'password')])
+
+    arg_dict = {}
+    for key, value in module.params.items():
+        if value is not None:
+            arg_dict[key] = value
+
+    cmd_output = {}
+    action = cmd_builder.condition_check(conditions=conditions, command_build_dict=arg_dict)
+    if len(action) > 0:
+        try:
+            cmd_output['output'] = dd_connect.dd_stats(module.params['host'], module.params['username'],
+                                                       module.params['dd-password'] or module.params['password'],
+                                                       module=conditions[action]['rest']['module'],
+                                                       start=module.params['start'], end=module.params['end'],
+                                                       interval=module.params['interval'],
+                                                       data_view=module.params['data-view'],
+                                                       page_size=module.params['page-size'])
+            cmd_output['failed'] = False
+        except Exception as e:
+            cmd_output['output'] = str(e)
+            cmd_output['failed'] = True
+    else:
+        cmd_output['output'] = f'No statistics available for state "{arg_dict["state"]}"'
+        cmd_output['failed'] = True
+    module.exit_json(failed=cmd_output['failed'], msg=cmd_output['output'], changed=False)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,186 @@
+# Copyright ©️ 2022 Dell Inc. or its subsidiaries.
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+import pytest
+
+from ansible_collections.dellemc.datadomain.plugins.module_utils import cmd_builder, dd_connect
+from ansible_collections.dellemc.datadomain.plugins.module_utils.catalogues.compression import compression
+from ansible_collections.dellemc.datadomain.plugins.module_utils.catalogues.filesys import filesys
+from ansible_collections.dellemc.datadomain.plugins.module_utils.catalogues.mtree import mtree
+from ansible_collections.dellemc.datadomain.plugins.module_utils.catalogues.net import net
+from ansible_collections.dellemc.datadomain.plugins.module_utils.catalogues.users import users
+
+USERS_SPEC = {
+    'state': {'type': 'str', 'choices': ['add', 'del', 'change', 'enable', 'disable', 'set', 'reset', 'show']},
+    'user-name': {'type': 'str'},
+    'role-name': {'type': 'str', 'choices': ['admin', 'limited-admin', 'user', 'backup-operator', 'none']},
+    'user-password': {'type': 'str', 'no_log': True},
+    'dd-password': {'type': 'str', 'no_log': True},
+    'new-password': {'type': 'str', 'no_log': True},
+    'aging': {'type': 'dict', 'options': {'min-days-between-change': {'type': 'int'}}},
+    'items': {'type': 'list', 'elements': 'dict'},
+    'host': {'type': 'str', 'required': True},
+    'port': {'type': 'int', 'default': 22},
+    'username': {'type': 'str', 'required': True},
+    'password': {'type': 'str', 'no_log': True},
+}
+
+
+class FakeModule:
+    def __init__(self, params, argument_spec):
+        self.params = params
+        self.argument_spec = argument_spec
+        self.no_log_values = set()
+
+
+@pytest.fixture
+def sent(monkeypatch):
+    calls = []
+
+    def ssh_batch(server, user, port, commands, private_key=None, password=None, decode=True):
+        calls.append(('ssh', list(commands)))
+        return [dict(failed=False, output='') for command in commands]
+
+    def bulk_requests(server, user, api_pass, version, module, request_type, payloads, is_filters=None,
+                      max_in_flight=8):
+        calls.append(('rest', module, request_type, list(payloads)))
+        return [dict(failed=False, output={}) for payload in payloads]
+
+    monkeypatch.setattr(dd_connect, 'dd_ssh_batch', ssh_batch)
+    monkeypatch.setattr(dd_connect, 'dd_bulk_requests', bulk_requests)
+    monkeypatch.setattr(dd_connect, 'TRANSPORT_STATS_FILE', None)
+    return calls
+
+
+def run_users(items):
+    conditions, supported_commands = users()
+    module = FakeModule({'state': 'add', 'password': 'secret', 'dd-password': 'secret'}, USERS_SPEC)
+    results, changed, failed = cmd_builder.run_items(module, {'state': 'add', 'port': 22, 'dd-password': 'secret'},
+                                                     items, conditions, supported_commands, 'dd01', 'sysadmin',
+                                                     22, None, 'secret')
+    return module, results
+
+
+def test_items_do_not_echo_secrets(sent):
+    module, results = run_users([{'user-name': 'u1', 'role-name': 'user', 'user-password': 'Pa55word!'},
+                                 {'state': 'change', 'user-name': 'u1', 'user-password': 'Pa55word!',
+                                  'new-password': 'N3wPa55!'}])
+    assert [result['failed'] for result in results] == [False, False]
+    assert results[0]['item'] == {'user-name': 'u1', 'role-name': 'user', 'user-password': cmd_builder.NO_LOG_MASK}
+    assert 'N3wPa55!' not in repr(results)
+    assert {'Pa55word!', 'N3wPa55!'} <= module.no_log_values
+    assert [call[:3] for call in sent] == [('rest', 'users', 'post'), ('rest', 'users', 'put')]
+
+
+def test_items_are_validated_against_the_argument_spec(sent):
+    module, results = run_users([{'user-name': 'u2', 'role-name': 'superuser'},
+                                 {'state': 'bogus', 'user-name': 'u3'},
+                                 {'state': 'set', 'aging': {'min-days-between-change': 'ten'}},
+                                 {'state': 'set', 'aging': {'min-days-between-change': '10'}}])
+    assert [result['failed'] for result in results] == [True, True, True, False]
+    assert 'role-name' in results[0]['output']
+    assert 'state' in results[1]['output']
+    assert 'min-days-between-change' in results[2]['output']
+    assert sent == [('ssh', ['user password aging option set min-days-between-change 10'])]
+
+
+def test_items_take_the_module_options():
+    items = cmd_builder.item_argument(USERS_SPEC)
+    assert (items['type'], items['elements']) == ('list', 'dict')
+    assert sorted(items['options']) == ['aging', 'new-password', 'role-name', 'state', 'user-name', 'user-password']
+    assert items['options']['user-password'] == {'type': 'str', 'no_log': True}
+    assert items['options']['aging'] == USERS_SPEC['aging']
+    assert cmd_builder.item_option({'type': 'int', 'default': 22, 'required': True}) == {'type': 'int'}
+
+
+def test_items_leave_out_unset_sub_options(sent):
+    module, results = run_users([{'user-name': 'u1', 'role-name': 'user', 'user-password': 'Pa55word!',
+                                  'new-password': None, 'aging': None},
+                                 {'state': 'set', 'user-name': None,
+                                  'aging': {'min-days-between-change': 10, 'max-days-between-change': None}}])
+    assert [result['item'] for result in results] == [
+        {'user-name': 'u1', 'role-name': 'user', 'user-password': cmd_builder.NO_LOG_MASK},
+        {'state': 'set', 'aging': {'min-days-between-change': 10}}]
+    assert [result['failed'] for result in results] == [False, False]
+
+
+def test_command_hook_applies_to_items(sent):
+    conditions, supported_commands = compression()
+    spec = {'state': {'type': 'str'}, 'schedule': {'type': 'dict'}, 'items': {'type': 'list', 'elements': 'dict'}}
+    module = FakeModule({'state': 'create', 'password': 'secret'}, spec)
+    cmd_builder.run_items(module, {'state': 'create'}, [{'schedule': {'name': 'sched1', 'time': '10:00'}}],
+                          conditions, supported_commands, 'dd01', 'sysadmin', 22, None, 'secret',
+                          command_hook=lambda action, command: [command[0].replace('name', '')])
+    assert sent == [('ssh', ['compression physical-capacity-measurement schedule create  sched1 time 1000'])]
+
+
+@pytest.mark.parametrize('output_format', ['structured', 'columnar'])
+def test_rest_records_match_the_ssh_rows(output_format):
+    conditions, supported_commands = mtree()
+    table = (
+        'Name                             Pre-Comp (GiB)   Status\n'
+        '------------------------------   --------------   ------\n'
+        '/data/col1/backup                         312.5   RW\n'
+        '/data/col1/archive                          0.0   RO\n'
+        '------------------------------   --------------   ------\n'
+    )
+    records = [dict(id='backup', name='/data/col1/backup', status='RW', logical_capacity=dict(used=335544320000)),
+               dict(id='archive', name='/data/col1/archive', status='RO', logical_capacity=dict(used=0))]
+    assert conditions['mtree_list']['transports'] == ['ssh', 'rest']
+    assert (cmd_builder.parse_output('mtree_list', conditions, records, output_format) ==
+            cmd_builder.parse_output('mtree_list', conditions, table, output_format))
+
+
+def test_command_spec_renders_cli_commands():
+    spec = cmd_builder.command_spec('["net create virtual veth$vethid", "echo $$HOME ${name}s"]')
+    assert spec['payload'] is False
+    assert cmd_builder.render_command(spec, {'vethid': 12, 'name': 'share'}) == ['net create virtual veth12',
+                                                                                 'echo $HOME shares']
+    assert cmd_builder.command_spec('["net create virtual veth$vethid", "echo $$HOME ${name}s"]') is spec
+
+
+def test_command_spec_renders_payloads_with_quotes():
+    conditions, supported_commands = users()
+    spec = cmd_builder.command_spec(supported_commands['user_add'])
+    password = 'Pa"55\'w\\ord'
+    payload = cmd_builder.render_command(spec, {'user_name': 'u1', 'role_name': 'user', 'user_password': password})
+    assert spec['payload'] is True
+    assert payload == {'name': 'u1', 'role': 'user', 'password': password}
+
+
+def test_command_spec_rejects_invalid_placeholders():
+    with pytest.raises(ValueError):
+        cmd_builder.command_spec('["mtree create $ 1"]')
+
+
+DISPATCH = [
+    (filesys, {'state': 'reset', 'operation': 'encryption', 'encryption': 'embedded-key-manager'},
+     'filesys_encryption_ekmgr_reset'),
+    (filesys, {'state': 'reset', 'operation': 'encryption', 'encryption': 'algorithm'}, 'filesys_encryption_reset'),
+    (filesys, {'state': 'disable', 'operation': 'encryption', 'encryption': 'key-manager'},
+     'filesys_encryption_km_disable'),
+    (filesys, {'state': 'disable', 'operation': 'encryption'}, 'filesys_encryption_disable'),
+    (filesys, {'state': 'set', 'operation': 'encryption', 'encryption': 'key-manager', 'key-rotation-policy': '1'},
+     'filesys_encryption_km_krp_set'),
+    (filesys, {'state': 'status', 'operation': 'clean'}, 'filesys_clean_status'),
+    (filesys, {'state': 'status'}, 'filesys_status'),
+    (filesys, {'state': 'show', 'operation': 'space'}, 'filesys_show_space'),
+    (net, {'state': 'add', 'option': 'route', 'network': '10.0.0.0', 'netmask': '255.0.0.0', 'gateway': '10.0.0.1',
+           'ifname': 'eth0a', 'ipaddr': '10.0.0.5'}, 'net_route_net_add'),
+    (net, {'state': 'add', 'option': 'route', 'ipaddr': '10.0.0.5', 'gateway': '10.0.0.1', 'ifname': 'eth0a'},
+     'net_route_host_add'),
+    (net, {'state': 'set', 'option': 'dns', 'dns': '10.0.0.2'}, 'net_dns_set'),
+    (net, {'state': 'show'}, 'net_settings_show'),
+    (net, {'state': 'set', 'option': 'dns'}, ''),
+]
+
+
+@pytest.mark.parametrize('catalogue, arguments, action', DISPATCH)
+@pytest.mark.parametrize('reverse', [False, True])
+def test_condition_check_picks_the_most_specific_action(catalogue, arguments, action, reverse):
+    conditions, supported_commands = catalogue()
+    if reverse:
+        # Specificity, not declaration order, decides between overlapping conditions.
+        conditions = dict(reversed(list(conditions.items())))
+    assert cmd_builder.condition_check(conditions, arguments) == action
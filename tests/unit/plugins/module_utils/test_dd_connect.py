@@ -0,0 +1,97 @@
+# Copyright ©️ 2022 Dell Inc. or its subsidiaries.
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+import os
+import stat
+import sys
+
+import pytest
+
+from ansible_collections.dellemc.datadomain.plugins.module_utils import dd_connect
+
+# The stub lives in tools/, which built collections leave out (build_ignore).
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..', '..', '..', 'tools'))
+dd_rest_stub = pytest.importorskip('dd_rest_stub')
+
+
+@pytest.fixture
+def stub(monkeypatch):
+    server = dd_rest_stub.start_stub(port=0, stats_days=3)
+    monkeypatch.setattr(dd_connect, 'REST_PORT', server.server_port)
+    monkeypatch.setattr(dd_connect, 'REST_CACHE_DIR', None)
+    monkeypatch.setattr(dd_connect, 'rest_cache', {})
+    monkeypatch.setattr(dd_connect, 'rest_logins', set())
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def test_dd_stats_pages_through_the_whole_series(stub):
+    samples = stub.state.data['capacity_stats']['items']
+    series = dd_connect.dd_stats('127.0.0.1', 'sysadmin', 'secret', 'stats/capacity', page_size=10)
+    assert len(samples) > 20
+    assert series['collection_epoch'] == [sample['collection_epoch'] for sample in samples]
+    assert series['physical_capacity.used'] == [sample['physical_capacity']['used'] for sample in samples]
+    assert stub.state.stats['auth'] == 1
+    assert stub.state.stats['get'] == -(-len(samples) // 10)
+    assert dd_connect.rest_cache == {}
+
+
+def test_dd_stats_time_range(stub):
+    epochs = [sample['collection_epoch'] for sample in stub.state.data['performance_stats']['items']]
+    series = dd_connect.dd_stats('127.0.0.1', 'sysadmin', 'secret', 'stats/performance', start=epochs[5],
+                                 end=epochs[30], page_size=7)
+    assert series['collection_epoch'] == epochs[5:31]
+    assert series['streams.read'] == [n % 16 for n in range(5, 31)]
+
+
+def test_auth_and_reads_share_one_keep_alive_session(stub):
+    session = dd_connect.requests.Session()
+    token = dd_connect.dd_auth('127.0.0.1', 'sysadmin', 'secret', session=session)
+    for resource in ['users', 'nfs/exports']:
+        status, body = dd_connect.rest_get(session, '127.0.0.1', 'v1.0', resource,
+                                           headers={'X-DD-AUTH-TOKEN': token}, ttl=0)
+        assert status == 200
+    session.close()
+
+
+def test_bulk_requests_keep_order_and_share_one_login(stub):
+    names = [f'user{i:05d}' for i in [7, 3, 11, 0, 5]]
+    results = dd_connect.dd_bulk_requests('127.0.0.1', 'sysadmin', 'secret', 'v1.0', 'users', 'get',
+                                          [''] * len(names), is_filters=names, max_in_flight=4)
+    assert [result['failed'] for result in results] == [False] * len(names)
+    assert [result['output']['name'] for result in results] == names
+    assert stub.state.stats['auth'] == 1
+
+
+def test_bulk_requests_bound_requests_in_flight(stub):
+    stub.state.latency = 0.05
+    payloads = [dict(name=f'bulk{i:02d}') for i in range(12)]
+    results = dd_connect.dd_bulk_requests('127.0.0.1', 'sysadmin', 'secret', 'v1.0', 'users', 'post', payloads,
+                                          max_in_flight=3)
+    assert [result['output']['id'] for result in results] == [payload['name'] for payload in payloads]
+    assert stub.state.stats['write'] == 12
+    assert 1 < stub.state.stats['peak_in_flight'] <= 3
+
+
+def test_cached_reads_are_not_served_without_a_login(stub, monkeypatch, tmp_path):
+    monkeypatch.setattr(dd_connect, 'REST_CACHE_DIR', str(tmp_path))
+    stub.state.password = 'secret'
+
+    def read(user, api_pass):
+        return dict(dd_connect.dd_requests('127.0.0.1', user, api_pass, None, 'v1.0', 'users', 'get', ''))
+
+    assert read('sysadmin', 'secret')['failed'] is False
+    assert read('sysadmin', 'wrong')['failed'] is True
+    assert read('admin2', 'wrong')['failed'] is True
+    assert stub.state.stats['get'] == 1
+    files = [os.path.join(root, name) for root, dirs, names in os.walk(str(tmp_path)) for name in names]
+    assert len(files) == 1
+    assert stat.S_IMODE(os.stat(files[0]).st_mode) == 0o600
+    # A later task starts with an empty process cache but still finds the response on disk.
+    monkeypatch.setattr(dd_connect, 'rest_cache', {})
+    monkeypatch.setattr(dd_connect, 'rest_logins', set())
+    assert read('sysadmin', 'wrong')['failed'] is True
+    assert read('sysadmin', 'secret')['failed'] is False
+    assert stub.state.stats['not_modified'] == 1
@@ -0,0 +1,31 @@
+# Copyright ©️ 2022 Dell Inc. or its subsidiaries.
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+import math
+
+import pytest
+
+from ansible_collections.dellemc.datadomain.plugins.module_utils import dd_numeric
+
+pytestmark = pytest.mark.skipif(not dd_numeric.HAS_NUMPY, reason='numpy is not installed')
+
+TYPES = dict(size='size', used='size', factor='factor')
+
+
+def test_fleet_arrays_with_different_columns():
+    results = dict(dd01=[dict(tier='active', size=100, used=40, factor=2.0),
+                         dict(tier='cloud', size=50, used=10, factor=4.0)],
+                   dd02=dict(tier=['active'], size=[200]),
+                   dd03=[])
+    arrays = dd_numeric.fleet_arrays(results, TYPES)
+    assert all(len(array) == 3 for array in arrays.values())
+    assert arrays['host'].tolist() == ['dd01', 'dd01', 'dd02']
+    assert arrays['used'].tolist() == [40, 10, 0]
+    assert math.isnan(arrays['factor'][2])
+    active = dd_numeric.mask_rows(arrays, 'tier', 'active')
+    assert dd_numeric.totals(active, ['size', 'used']) == dict(size=300, used=40)
+
+
+def test_fleet_arrays_without_results():
+    assert dd_numeric.fleet_arrays({}, TYPES)['host'].tolist() == []
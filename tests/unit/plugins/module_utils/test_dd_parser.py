@@ -0,0 +1,106 @@
+# Copyright ©️ 2022 Dell Inc. or its subsidiaries.
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+import pytest
+
+from ansible_collections.dellemc.datadomain.plugins.module_utils import dd_parser
+
+MTREES = '''Name                             Pre-Comp (GiB)   Status
+------------------------------   --------------   ------
+/data/col1/backup                         312.5   RW
+/data/col1/archive                          0.0   RO
+------------------------------   --------------   ------
+ D    : Deleted
+'''
+EMPTY = '''Name                             Pre-Comp (GiB)   Status
+------------------------------   --------------   ------
+------------------------------   --------------   ------
+'''
+ROWS = [{'Name': '/data/col1/backup', 'Pre-Comp (GiB)': '312.5', 'Status': 'RW'},
+        {'Name': '/data/col1/archive', 'Pre-Comp (GiB)': '0.0', 'Status': 'RO'}]
+
+
+def parse_text(output):
+    return dd_parser.parse_table(output)
+
+
+def parse_bytes(output):
+    return dd_parser.parse_table_buffer(output.encode('utf-8'))
+
+
+def parse_lines(output):
+    return list(dd_parser.iter_rows(output.splitlines(True)))
+
+
+PARSERS = [parse_text, parse_bytes, parse_lines]
+
+
+@pytest.mark.parametrize('parse', PARSERS)
+def test_table(parse):
+    assert parse(MTREES) == ROWS
+
+
+@pytest.mark.parametrize('parse', PARSERS)
+@pytest.mark.parametrize('output', [EMPTY, EMPTY.rstrip('\n'), EMPTY + '\n', EMPTY.replace('\n', '\r\n')])
+def test_empty_table(parse, output):
+    assert parse(output) == []
+
+
+@pytest.mark.parametrize('parse', PARSERS)
+def test_crlf_table(parse):
+    assert parse(MTREES.replace('\n', '\r\n')) == ROWS
+
+
+@pytest.mark.parametrize('value, expected', [('1.5 GiB', 1610612736), ('2,048 KiB', 2097152), ('10', 10),
+                                             ('1.2.3 GiB', '1.2.3 GiB'), (', GiB', ', GiB'), ('n/a', 'n/a')])
+def test_to_bytes(value, expected):
+    assert dd_parser.to_bytes(value) == expected
+
+
+def test_malformed_size_keeps_the_row():
+    rows = dd_parser.parse_output(MTREES.replace('312.5', '3.1.2'), 'table', ['name', 'size', 'status'],
+                                  dict(size='gib'))
+    assert [row['size'] for row in rows] == ['3.1.2', 0]
+
+
+@pytest.mark.parametrize('output, expected', [
+    ('NTP is enabled and active.\nLocal time:   Mon Jun 14 2021 10:39:01 PDT\n',
+     [{'message': ['NTP is enabled and active.'], 'local_time': 'Mon Jun 14 2021 10:39:01 PDT'}]),
+    ('NTP is disabled.\n', [{'message': ['NTP is disabled.']}]),
+    ('NTP Enabled: yes\r\nServers:\r\n    10.0.0.1\r\n    10.0.0.2\r\n',
+     [{'ntp_enabled': 'yes', 'servers': ['10.0.0.1', '10.0.0.2']}]),
+    ('-----------   --------------\nMode          Workgroup\nNB Hostname   dd01\n-----------   --------------\n',
+     [{'mode': 'Workgroup', 'nb_hostname': 'dd01'}]),
+])
+def test_key_value(output, expected):
+    assert dd_parser.parse_output(output, 'key_value') == expected
+
+
+def test_diff_rows():
+    before = ROWS + [{'Name': '/data/col1/old', 'Pre-Comp (GiB)': '1.0', 'Status': 'RW'}]
+    after = [{'Name': '/data/col1/backup', 'Pre-Comp (GiB)': '400.0', 'Status': 'RW'}, ROWS[1],
+             {'Name': '/data/col1/new', 'Pre-Comp (GiB)': '0.0', 'Status': 'RW'}]
+    diff = dd_parser.diff_rows(before, after, 'Name')
+    assert diff['added'] == [after[2]]
+    assert diff['removed'] == [before[2]]
+    assert diff['changed'] == [dict(key='/data/col1/backup', columns=['Pre-Comp (GiB)'], before=ROWS[0],
+                                    after=after[0])]
+
+
+def test_diff_rows_on_a_composite_key():
+    before = [{'resource': 'Pre-Comp', 'tier': 'Active', 'size': 10},
+              {'resource': 'Pre-Comp', 'tier': 'Cloud', 'size': 5}]
+    after = [{'resource': 'Pre-Comp', 'tier': 'Active', 'size': 12},
+             {'resource': 'Pre-Comp', 'tier': 'Cloud', 'size': 5}]
+    diff = dd_parser.diff_rows(before, after, ['tier', 'resource'])
+    assert diff['added'] == diff['removed'] == []
+    assert [(change['key'], change['columns']) for change in diff['changed']] == [(('Active', 'Pre-Comp'), ['size'])]
+
+
+def test_diff_rows_of_columnar_output():
+    before = {'name': ['a', 'b'], 'size': [1, 2]}
+    after = {'name': ['b', 'c'], 'size': [3, 4]}
+    assert dd_parser.diff_rows(before, after, 'name') == dict(
+        added=[{'name': 'c', 'size': 4}], removed=[{'name': 'a', 'size': 1}],
+        changed=[dict(key='b', columns=['size'], before={'name': 'b', 'size': 2}, after={'name': 'b', 'size': 3})])
@@ -0,0 +1,160 @@
+# Copyright ©️ 2022 Dell Inc. or its subsidiaries.
+# Parser benchmark over the captured outputs in tools/corpus, one file per cmd_templates action that has a
+# header. Each capture is also scaled up to the requested row counts by repeating its table rows, with the
+# first column made unique and decimal values varied so converter caches do not flatter the numbers.
+#
+#   python tools/bench_parsers.py [--rows 1000 10000 100000] [--repeat 3] [--action mtree_list ...]
+#
+# For every action and size it reports rows/sec and peak traced memory of each parser path:
+#   sniff     tab_to_json(output, header), format guessed from the output
+#   declared  parse_output with the action's parser and types
+#   compact   declared, rows as slot based Row objects instead of dicts
+#   buffer    declared, from the undecoded bytes as dd_ssh returns them for table actions (table only)
+#   stream    iter_rows over the output lines, rows dropped once counted (table parser actions only)
+#   columnar  declared, then packed into one list per column
+#   memoized  declared with the in-memory parse cache on, i.e. the cost of a repeated identical output
+#
+# The parse cache is off for every other path so they measure real parsing.
+import argparse
+import os
+import re
+import sys
+import time
+import tracemalloc
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(HERE, '..', 'plugins', 'module_utils'))
+import cmd_templates  # noqa: E402
+import dd_parser  # noqa: E402
+
+CORPUS = os.path.join(HERE, 'corpus')
+DECIMAL = re.compile(r'(?<![\w.:/])\d+\.\d(?![\w.:])')
+UNIQUE = 7
+
+
+def header_actions():
+    actions = {}
+    for name, (conditions, supported_commands) in cmd_templates.catalogues():
+        for action, condition in conditions.items():
+            if condition.get('header'):
+                actions[action] = condition
+    return actions
+
+
+def vary(line, i):
+    def replace(match):
+        width = len(match.group())
+        return f'{(i * 7919) % 10 ** (width - 2) / 10:.1f}'.rjust(width)
+    return DECIMAL.sub(replace, line)
+
+
+def widen(line, end, cell):
+    return f'{line[:end].rstrip():<{end}}'[:end] + cell + line[end:]
+
+
+def scale(sample, rows):
+    # Every table body is repeated until it holds about `rows` rows. The first column is widened by
+    # UNIQUE characters, the way DDOS widens a column for longer values, to carry a row number.
+    lines = sample.split('\n')
+    out = []
+    i = 0
+    while i < len(lines):
+        line = lines[i]
+        if not dd_parser.SEPARATOR_LINE.match(line):
+            out.append(line)
+            i += 1
+            continue
+        end = dd_parser.DASH_RUN.search(line).end()
+        if out:
+            out[-1] = widen(out[-1], end, ' ' * UNIQUE)
+        out.append(widen(line, end, '-' * UNIQUE))
+        body = []
+        i += 1
+        while i < len(lines) and lines[i].strip() and not dd_parser.SEPARATOR_LINE.match(lines[i]):
+            body.append(lines[i])
+            i += 1
+        starts = sum(1 for line in body if line[:end].strip()) or 1
+        for n in range(max(1, rows // starts)):
+            for line in body:
+                line = vary(line, n)
+                if line[:end].strip():
+                    line = f'{line[:end].rstrip()}-{n:0{UNIQUE - 1}d}'.ljust(end + UNIQUE) + line[end:]
+                    out.append(line)
+                else:
+                    out.append(widen(line, end, ' ' * UNIQUE))
+        if i < len(lines) and dd_parser.SEPARATOR_LINE.match(lines[i]):
+            out.append(widen(lines[i], end, '-' * UNIQUE))
+            i += 1
+    return '\n'.join(out)
+
+
+def paths(condition):
+    parser, header, types = condition.get('parser'), condition['header'], condition.get('types')
+    found = dict(
+        sniff=lambda output: dd_parser.tab_to_json(output, header),
+        declared=lambda output: dd_parser.parse_output(output, parser, header, types),
+        compact=lambda output: dd_parser.parse_output(output, parser, header, types, compact=True),
+        columnar=lambda output: dd_parser.columnar_records(dd_parser.parse_output(output, parser, header, types)),
+        memoized=lambda output: dd_parser.parse_output(output, parser, header, types),
+    )
+    if parser == 'table':
+        found['buffer'] = lambda output: dd_parser.parse_output(output.encode('utf-8'), parser, header, types)
+        # Rows are counted and dropped, as a caller filtering the stream would.
+        found['stream'] = lambda output: sum(1 for row in dd_parser.iter_rows(output.split('\n'), header, types))
+    return found
+
+
+def measure(fn, output, repeat):
+    best = None
+    for _ in range(repeat):
+        started = time.perf_counter()
+        result = fn(output)
+        elapsed = time.perf_counter() - started
+        best = elapsed if best is None else min(best, elapsed)
+    tracemalloc.start()
+    fn(output)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    if isinstance(result, int):
+        rows = result
+    elif isinstance(result, dict):
+        rows = len(next(iter(result.values()), []))
+    else:
+        rows = len(result)
+    return rows, best, peak
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark the DDOS output parsers')
+    parser.add_argument('--rows', type=int, nargs='+', default=[1000, 10000, 100000])
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--action', nargs='+', help='only these cmd_templates actions')
+    parser.add_argument('--corpus', default=CORPUS)
+    args = parser.parse_args()
+    dd_parser.PARSE_CACHE_DIR = None
+
+    print(f'{"action":<26}{"size":>9}  {"path":<9}{"rows":>9}{"seconds":>10}{"rows/s":>12}{"peak MiB":>10}')
+    for action, condition in sorted(header_actions().items()):
+        if args.action and action not in args.action:
+            continue
+        capture = os.path.join(args.corpus, f'{action}.txt')
+        if not os.path.exists(capture):
+            print(f'{action:<26}  no capture in {args.corpus}')
+            continue
+        with open(capture) as handle:
+            sample = handle.read()
+        for size, output in [('capture', sample)] + [(str(rows), scale(sample, rows)) for rows in args.rows]:
+            for name, fn in paths(condition).items():
+                dd_parser.parse_cache.clear()
+                dd_parser.PARSE_CACHE_SIZE = 64 if name == 'memoized' else 0
+                for convert in dd_parser.CONVERTERS.values():
+                    if hasattr(convert, 'cache_clear'):
+                        convert.cache_clear()
+                rows, seconds, peak = measure(fn, output, args.repeat)
+                rate = rows / seconds if seconds else 0
+                print(f'{action:<26}{size:>9}  {name:<9}{rows:>9}{seconds:>10.4f}{rate:>12.0f}'
+                      f'{peak / 1048576:>10.1f}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,188 @@
+# Copyright ©️ 2022 Dell Inc. or its subsidiaries.
+# Times tab_to_json against the implementation it replaced on synthetic 100k-line outputs.
+#
+#   python tools/bench_tab_to_json.py [--lines 100000] [--repeat 3]
+import argparse
+import os
+import re
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'plugins', 'module_utils'))
+import dd_parser  # noqa: E402
+
+MTREE_HEADER = ['name', 'size', 'status']
+USER_HEADER = ['name', 'uid', 'role', 'last_login_from', 'last_login_time', 'status', 'disable_date']
+
+
+def mtree_list(lines):
+    rule = '-' * 40 + '   ' + '-' * 14 + '   ' + '-' * 7
+    rows = [f'{"/data/col1/mtree%06d" % i:<40}   {i % 9000 + 0.5:>14.1f}   {["RW", "RO", "RW/RLCE"][i % 3]:<7}'
+            for i in range(lines)]
+    return '\n'.join([f'{"Name":<40}   {"Pre-Comp (GiB)":<14}   Status', rule] + rows + [rule, ' D    : Deleted'])
+
+
+def user_list(lines):
+    widths = [12, 6, 15, 15, 24, 8, 12]
+    rule = '   '.join('-' * w for w in widths)
+    rows = []
+    for i in range(lines):
+        cells = [f'user{i:06d}', str(1000 + i), ['admin', 'user', 'backup-operator'][i % 3], '10.0.0.%d' % (i % 250),
+                 'Mon Oct 10 10:10:10 2022', 'enabled', 'never']
+        rows.append('   '.join(f'{c:<{w}}' for c, w in zip(cells, widths)))
+    head = '   '.join(f'{c:<{w}}' for c, w in zip(['Name', 'Uid', 'Role', 'Last Login From', 'Last Login Time',
+                                                   'Status', 'Disable Date'], widths))
+    return '\n'.join([head, rule] + rows + [rule])
+
+
+def key_value(lines):
+    blocks = []
+    for i in range(lines // 4):
+        blocks.append(f'Share name: share{i}\nPath: /data/col1/mtree{i}\nMax connections: {i % 100}\nComment:')
+    return '\n\n'.join(blocks)
+
+
+def options(lines):
+    rows = [f'option-{i:06d}      value{i}' for i in range(lines)]
+    return '\n'.join(['Option             Value', '-----------------  ---------'] + rows)
+
+
+def best_of(repeat, fn, *args):
+    best = None
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn(*args)
+        elapsed = time.perf_counter() - started
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def legacy_tab_to_json(output, header=None):
+    final_data = []
+    if "--" in str(output) and "Option" not in str(output) and '- share' not in str(output):
+        commandOut = output.split('\n')
+        lookup = "--"
+        i = 0
+        p = 0
+        out = {}
+        data_frames = []
+        for line in commandOut:
+            i += 1
+            if lookup in line:
+                out[p] = i - 1
+                p += 1
+        p = 0
+        total_lines = len(out) - 1
+        if total_lines == 0:
+            out[1] = out[0] + 2
+            total_lines = 1
+        while p < total_lines:
+            start_line = out[p] + 1
+            p += 1
+            end_line = out[p]
+            data_frames.append(commandOut[start_line:end_line])
+        for line in data_frames:
+            for l in line:
+                data = {}
+                obj = re.split('\s\s\s+', l.strip())
+                i = 0
+                if len(obj) >= (len(header) - 1):
+                    for o in obj:
+                        data[header[i]] = o
+                        i = i + 1
+                    final_data.append(data)
+        return final_data
+    elif "Option" in str(output) and 'Value' in str(output):
+        cmdOutput = output.split('\n\n')
+        for section in cmdOutput:
+            data = {}
+            section = section.strip()
+            lines = section.split('\n')
+
+            if ':' in lines[0]:
+                mkey = lines[0].strip().replace(':', '')
+                data[mkey] = {}
+                for line in lines[1:]:
+                    if '--' not in line and 'Option' not in line:
+                        key, value = re.split('\s\s+', line.strip())
+                        data[mkey][key] = value
+                final_data.append(data)
+            else:
+                mkeys = re.split('\s\s+', lines[0].strip())
+                if 'Option' in mkeys:
+
+                    for line in lines[1:]:
+
+                        if '--' not in line and len(line) > 0:
+                            data = {}
+                            key, value = re.split('\s\s+', line.strip())
+                            data[key] = value
+                            final_data.append(data)
+                else:
+                    for line in lines[1:]:
+                        data = {}
+                        if '--' not in line and 'Option' not in line:
+                            values = re.split('\s\s+', line.strip())
+                            i = 0
+                            for value in values:
+                                data[mkeys[i]] = value
+                                i += 1
+                            final_data.append(data)
+        return final_data
+    elif ': ' in str(output):
+        cmdOutput = output.split('\n\n')
+        for line in cmdOutput:
+            if len(line.strip()) > 0:
+                obj = line.split('\n')
+                data = {}
+                for o in obj:
+                    if ":" in o:
+                        key, value = o.split(":", 1)
+
+                        if len(value.strip()) > 0:
+                            data[key.strip().lower().replace(' ', '_')] = value.strip()
+                        else:
+                            data[key.strip().lower().replace(' ', '_')] = []
+                    else:
+                        if len(o) > 0 and '*' not in o:
+                            try:
+                                key, value = re.split('\s\s+', o.strip())
+                                data[key.lower().replace(' ', '_')] = value.strip()
+                            except Exception as e:
+                                # print(e)
+                                pass
+
+                final_data.append(data)
+        return final_data
+    else:
+        data = {}
+        data['output'] = []
+        cmdOutput = output.split('\n')
+        for line in cmdOutput:
+            if len(line) > 0:
+                data['output'].append(line)
+        final_data.append(data)
+        return final_data
+
+
+def main():
+    parser = argparse.ArgumentParser(description='tab_to_json benchmark')
+    parser.add_argument('--lines', type=int, default=100000)
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+    # Repeated runs would otherwise be answered from the parse cache.
+    dd_parser.PARSE_CACHE_SIZE = 0
+    dd_parser.PARSE_CACHE_DIR = None
+    cases = [('mtree list', mtree_list(args.lines), MTREE_HEADER),
+             ('user show list', user_list(args.lines), USER_HEADER),
+             ('key: value', key_value(args.lines), None),
+             ('option table', options(args.lines), None)]
+    print(f'{"output":<16}{"legacy s":>12}{"current s":>12}{"speed-up":>10}')
+    for name, output, header in cases:
+        legacy = best_of(args.repeat, legacy_tab_to_json, output, header)
+        current = best_of(args.repeat, dd_parser.tab_to_json, output, header)
+        print(f'{name:<16}{legacy:>12.3f}{current:>12.3f}{legacy / current:>9.1f}x')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,29 @@
+# Copyright ©️ 2022 Dell Inc. or its subsidiaries.
+# Checks every command catalogue in plugins/module_utils/catalogues with the shared validator, including
+# the parser and column type names against dd_parser. Prints the problems and exits non-zero if any.
+#
+#   python tools/check_catalogues.py [catalogue ...]
+import os
+import sys
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(HERE, '..', 'plugins', 'module_utils'))
+import cmd_templates  # noqa: E402
+import dd_parser  # noqa: E402
+
+
+def main():
+    names = sys.argv[1:] or cmd_templates.CATALOGUES
+    failed = False
+    for name in names:
+        problems = cmd_templates.validate(name, dd_parser.PARSERS, dd_parser.CONVERTERS)
+        for problem in problems:
+            print(f'{name}: {problem}')
+        failed = failed or bool(problems)
+    if not failed:
+        print(f'{len(names)} catalogues ok')
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,291 @@
+# Copyright ©️ 2022 Dell Inc. or its subsidiaries.
+# Local stand-in for the DDOS REST API on port 3009, for exercising dd_connect without an appliance.
+#
+#   python tools/dd_rest_stub.py --port 3009 --latency 20 --users 5000 --mtrees 20000
+#
+# Then point the collection at 127.0.0.1. It serves auth, users, mtrees, nfs exports, file system
+# capacity and hourly capacity/performance history under stats/. List endpoints honour page/size and
+# return paging_info, GETs carry ETag/Last-Modified and answer conditional requests with 304, and
+# writes bump the resource version.
+import argparse
+import json
+import os
+import re
+import shutil
+import ssl
+import subprocess
+import tempfile
+import threading
+import time
+import uuid
+from email.utils import formatdate, parsedate_to_datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+SYSTEM_PATH = re.compile(r'^/rest/(?P<version>v\d+\.\d+)/dd-systems/0/(?P<resource>[^?]+?)/?$')
+AUTH_PATH = re.compile(r'^/rest/v\d+\.\d+/auth/?$')
+EPOCH_FILTER = re.compile(r'collection_epoch\s*(?P<op>>=|<=)\s*(?P<value>\d+)')
+RESOURCES = {'nfs/exports': 'exports', 'file-systems': 'capacity',
+             'stats/capacity': 'capacity_stats', 'stats/performance': 'performance_stats'}
+
+
+def build_dataset(users=100, mtrees=100, exports=100, stats_days=7):
+    now = int(time.time()) // 3600 * 3600
+    epochs = range(now - stats_days * 86400, now, 3600)
+    data = dict(
+        users=dict(key='user', items=[dict(id=f'user{i:05d}', name=f'user{i:05d}', uid=1000 + i,
+                                           role=['admin', 'user', 'backup-operator'][i % 3],
+                                           status='enabled' if i % 7 else 'disabled')
+                                      for i in range(users)]),
+        mtrees=dict(key='mtree', items=[dict(id=f'mtree{i:05d}', name=f'/data/col1/mtree{i:05d}',
+                                             status=['RW', 'RO', 'RW/RLCE'][i % 3],
+                                             logical_capacity=dict(used=i * 1073741824))
+                                        for i in range(mtrees)]),
+        exports=dict(key='export', items=[dict(id=f'export{i:05d}', name=f'export{i:05d}',
+                                               path=f'/data/col1/mtree{i:05d}', clients=[dict(name='*')])
+                                          for i in range(exports)]),
+        capacity=dict(physical_capacity=dict(total=109951162777600, used=21990232555520,
+                                             available=87960930222080),
+                      compression_factor=9.7),
+        capacity_stats=dict(key='capacity_stats', items=[
+            dict(collection_epoch=epoch, tier='active',
+                 physical_capacity=dict(total=109951162777600, used=21990232555520 + n * 1073741824),
+                 logical_capacity=dict(used=(21990232555520 + n * 1073741824) * 9),
+                 compression_factor=9.0 + (n % 10) / 10.0)
+            for n, epoch in enumerate(epochs)]),
+        performance_stats=dict(key='performance_stats', items=[
+            dict(collection_epoch=epoch, read_throughput=200.0 + n % 50, write_throughput=400.0 + n % 80,
+                 replication_throughput=50.0 + n % 20, streams=dict(read=n % 16, write=n % 32))
+            for n, epoch in enumerate(epochs)]),
+    )
+    for name in ['users', 'mtrees', 'exports']:
+        data[name]['index'] = dict((item['id'], item) for item in data[name]['items'])
+    return data
+
+
+class StubState:
+    def __init__(self, latency=0.0, password=None, **sizes):
+        self.latency = latency
+        self.password = password
+        self.data = build_dataset(**sizes)
+        self.tokens = set()
+        self.versions = {}
+        self.lock = threading.Lock()
+        self.in_flight = 0
+        self.stats = dict(auth=0, get=0, write=0, not_modified=0, peak_in_flight=0)
+
+    def touch(self, resource):
+        # Versions are whole seconds and every write moves them on by at least one, so Last-Modified, which
+        # only has second resolution, still tells two writes within the same second apart.
+        self.versions[resource] = max(int(time.time()), self.version(resource) + 1)
+
+    def version(self, resource):
+        return self.versions.setdefault(resource, int(time.time()))
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+    state = None
+
+    def log_message(self, format, *args):
+        pass
+
+    def reply(self, status, body=None, headers=None):
+        payload = b'' if body is None else json.dumps(body).encode('utf-8')
+        self.send_response(status)
+        for key, value in (headers or {}).items():
+            self.send_header(key, value)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(payload)))
+        self.end_headers()
+        if payload:
+            self.wfile.write(payload)
+
+    def body(self):
+        length = int(self.headers.get('Content-Length') or 0)
+        raw = self.rfile.read(length) if length else b''
+        try:
+            return json.loads(raw or b'{}')
+        except ValueError:
+            return {}
+
+    def route(self):
+        if self.state.latency:
+            # Requests overlap while they wait out the latency, peak_in_flight is the most seen at once.
+            with self.state.lock:
+                self.state.in_flight += 1
+                self.state.stats['peak_in_flight'] = max(self.state.stats['peak_in_flight'], self.state.in_flight)
+            time.sleep(self.state.latency)
+            with self.state.lock:
+                self.state.in_flight -= 1
+        url = urlparse(self.path)
+        if AUTH_PATH.match(url.path):
+            return 'auth', None, None, url
+        match = SYSTEM_PATH.match(url.path)
+        if match is None:
+            return None, None, None, url
+        path = match.group('resource')
+        for prefix, resource in RESOURCES.items():
+            if path == prefix or path.startswith(prefix + '/'):
+                item_id = path[len(prefix) + 1:] or None
+                break
+        else:
+            resource, _, item_id = path.partition('/')
+            item_id = item_id or None
+        if self.headers.get('X-DD-AUTH-TOKEN') not in self.state.tokens:
+            self.reply(401, dict(code=401, details='Unauthorized'))
+            return 'denied', None, None, url
+        return resource, item_id, match.group('version'), url
+
+    def do_POST(self):
+        # The body is read before anything is answered, a keep-alive connection would otherwise take what is
+        # left of it for the start of the next request.
+        item = self.body()
+        resource, item_id, version, url = self.route()
+        if resource == 'denied':
+            return
+        if resource == 'auth':
+            # Any credentials log in unless the stub was started with a password.
+            if self.state.password is not None and item.get('auth_info', item).get('password') != self.state.password:
+                return self.reply(401, dict(code=401, details='Invalid credentials'))
+            token = uuid.uuid4().hex
+            with self.state.lock:
+                self.state.tokens.add(token)
+                self.state.stats['auth'] += 1
+            return self.reply(201, dict(auth_info=dict(username='stub')), {'X-DD-AUTH-TOKEN': token})
+        if resource not in ('users', 'mtrees', 'exports'):
+            return self.reply(404, dict(code=404, details=f'{url.path} not found'))
+        item['id'] = item.get('name') or uuid.uuid4().hex
+        with self.state.lock:
+            collection = self.state.data[resource]
+            if item['id'] in collection['index']:
+                return self.reply(409, dict(code=409, details=f"{item['id']} already exists"))
+            collection['items'].append(item)
+            collection['index'][item['id']] = item
+            self.state.touch(resource)
+            self.state.stats['write'] += 1
+        self.reply(201, item)
+
+    def do_PUT(self):
+        changes = self.body()
+        resource, item_id, version, url = self.route()
+        if resource == 'denied':
+            return
+        collection = self.state.data.get(resource)
+        if not isinstance(collection, dict) or 'index' not in collection or item_id not in collection['index']:
+            return self.reply(404, dict(code=404, details=f'{url.path} not found'))
+        with self.state.lock:
+            collection['index'][item_id].update(changes)
+            self.state.touch(resource)
+            self.state.stats['write'] += 1
+        self.reply(200, collection['index'][item_id])
+
+    def do_GET(self):
+        resource, item_id, version, url = self.route()
+        if resource == 'denied':
+            return
+        if resource not in self.state.data:
+            return self.reply(404, dict(code=404, details=f'{url.path} not found'))
+        with self.state.lock:
+            self.state.stats['get'] += 1
+        modified = self.state.version(resource)
+        etag = f'"{resource}-{modified}"'
+        headers = {'ETag': etag, 'Last-Modified': formatdate(modified, usegmt=True)}
+        if self.not_modified(etag, modified):
+            with self.state.lock:
+                self.state.stats['not_modified'] += 1
+            return self.reply(304, headers=headers)
+        collection = self.state.data[resource]
+        if 'items' not in collection:
+            return self.reply(200, collection, headers)
+        if item_id is not None:
+            if item_id not in collection['index']:
+                return self.reply(404, dict(code=404, details=f'{url.path} not found'))
+            return self.reply(200, collection['index'][item_id], headers)
+        query = parse_qs(url.query)
+        page = int(query.get('page', ['0'])[0])
+        size = int(query.get('size', ['100'])[0])
+        matching = collection['items']
+        for bound in EPOCH_FILTER.finditer(query.get('filter', [''])[0]):
+            value = int(bound.group('value'))
+            if bound.group('op') == '>=':
+                matching = [item for item in matching if item['collection_epoch'] >= value]
+            else:
+                matching = [item for item in matching if item['collection_epoch'] <= value]
+        items = matching[page * size:(page + 1) * size]
+        body = {collection['key']: items,
+                'paging_info': dict(current_page=page, page_entries=len(items),
+                                    total_entries=len(matching), page_size=size)}
+        self.reply(200, body, headers)
+
+    def not_modified(self, etag, modified):
+        # RFC 7232 section 6: If-Modified-Since is only evaluated when the request has no If-None-Match.
+        match = self.headers.get('If-None-Match')
+        if match is not None:
+            return etag in [tag.strip() for tag in match.split(',')] or match.strip() == '*'
+        since = self.headers.get('If-Modified-Since')
+        if not since:
+            return False
+        try:
+            return modified <= parsedate_to_datetime(since).timestamp()
+        except (TypeError, ValueError):
+            return False
+
+
+def self_signed_cert(directory):
+    certfile = os.path.join(directory, 'stub.crt')
+    keyfile = os.path.join(directory, 'stub.key')
+    subprocess.run(['openssl', 'req', '-x509', '-newkey', 'rsa:2048', '-nodes', '-subj', '/CN=localhost',
+                    '-days', '1', '-keyout', keyfile, '-out', certfile],
+                   check=True, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    return certfile, keyfile
+
+
+def start_stub(host='127.0.0.1', port=3009, latency=0.0, users=100, mtrees=100, exports=100, stats_days=7,
+               certfile=None, keyfile=None, password=None):
+    # Starts the stub on a background thread and returns the server; its .state.stats counts requests
+    # and server.shutdown() stops it. Port 0 picks a free port, read it back from server.server_port.
+    handler = type('Handler', (StubHandler,), dict(state=StubState(latency, password, users=users, mtrees=mtrees,
+                                                                   exports=exports, stats_days=stats_days)))
+    server = ThreadingHTTPServer((host, port), handler)
+    server.daemon_threads = True
+    server.state = handler.state
+    certdir = None
+    if certfile is None:
+        certdir = tempfile.mkdtemp(prefix='dd_rest_stub')
+        certfile, keyfile = self_signed_cert(certdir)
+    context = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
+    context.load_cert_chain(certfile, keyfile)
+    server.socket = context.wrap_socket(server.socket, server_side=True)
+    if certdir is not None:
+        shutil.rmtree(certdir, ignore_errors=True)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    return server
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Local DDOS REST API stub')
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=3009)
+    parser.add_argument('--latency', type=float, default=0.0, help='added latency per request in ms')
+    parser.add_argument('--users', type=int, default=100)
+    parser.add_argument('--mtrees', type=int, default=100)
+    parser.add_argument('--exports', type=int, default=100)
+    parser.add_argument('--stats-days', type=int, default=7, help='days of hourly stats history')
+    parser.add_argument('--certfile')
+    parser.add_argument('--keyfile')
+    parser.add_argument('--password', help='only accept this password at login, any password otherwise')
+    args = parser.parse_args()
+    server = start_stub(args.host, args.port, args.latency / 1000.0, args.users, args.mtrees, args.exports,
+                        args.stats_days, args.certfile, args.keyfile, args.password)
+    print(f'DDOS REST stub listening on https://{args.host}:{server.server_port}')
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        server.shutdown()
+
+
+if __name__ == '__main__':
+    main()